@@ -0,0 +1,62 @@
+"""
+Offline bake of all graphic assets into one bundle file.
+
+The bundle holds the atlas pages of every spritesheet / PNG declared in assets/manifest.json
+as raw pixel buffers (scale 1 plus the scales listed in the manifest) and a binary index
+(frames, durations, tags, offsets). The game memory-maps it instead of decoding and slicing
+the PNGs when a state's asset group is loaded.
+
+    python bake_bundle.py
+    python bake_bundle.py --manifest assets/manifest.json --out assets/bundle.pmb
+"""
+import argparse
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # no window needed to bake
+
+import pygame
+from managers.graphic_manager import GraphicManager
+from managers.asset_bundle import write_bundle, bake_flags
+from managers.asset_manifest import AssetManifest
+
+BUNDLE_PATH = "assets/bundle.pmb"
+MANIFEST_PATH = "assets/manifest.json"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bake all graphic assets into one memory-mappable bundle.")
+    parser.add_argument("--out", default=BUNDLE_PATH, help=f"bundle file to write (default: {BUNDLE_PATH})")
+    parser.add_argument("--manifest", default=MANIFEST_PATH, help=f"asset manifest to bake (default: {MANIFEST_PATH})")
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))  # convert_alpha() needs a display surface
+
+    gm = GraphicManager()
+    # bake with the loader flags main.py sets, a bundle baked with other flags is ignored as stale
+    #gm.use_atlas = True
+    #gm.trim_frames = True
+    #gm.dedup_frames = True
+    #gm.optimize_blits = True
+
+    # every sheet / PNG of every group at its listed scales (scale 1 is always built alongside)
+    manifest = AssetManifest(args.manifest, gm, None)  # only the declarations are read, no sound needed
+    spritesheets, pngs = [], []
+    for group in manifest.groups.values():
+        for name, entry in group.get("spritesheets", {}).items():
+            if entry.get("indexed"):
+                continue  # indexed sheets are loaded from source, bundles hold 32-bit pixels only
+            spritesheets += [(name, entry["image"], entry["json"], scale) for scale in entry.get("scales", [1])]
+        for name, entry in group.get("pngs", {}).items():
+            pngs += [(name, entry["image"], scale) for scale in entry.get("scales", [1])]
+    gm.load_many(spritesheets=spritesheets, pngs=pngs)
+
+    animations = [anim for scales in gm.animations.values() for anim in scales.values()]
+    write_bundle(args.out, animations, bake_flags(gm))
+    print(f"Baked {len(animations)} animations into '{args.out}' ({os.path.getsize(args.out) / (1024 * 1024):.1f} MB).")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
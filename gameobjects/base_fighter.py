@@ -1,4 +1,4 @@
-from gameobjects.sprite import RenderAnchor
+from gameobjects.sprite import RenderAnchor, RenderLayer
 from gameobjects.game_object import GameObject
 from managers.input_manager import Action
 from gameobjects.components.player_controller_component import PlayerController
@@ -9,6 +9,7 @@ class BaseFighter(GameObject):
         super().__init__(world_pos, render_anchor=RenderAnchor.BOTTOMCENTER)
     
         self.enable_camera()
+        self.layer = RenderLayer.FIGHTERS
 
         # Movement attributes
         self.speed = 100
@@ -47,5 +48,5 @@ class BaseFighter(GameObject):
         if actions.get(Action.UP, False):
             self.physics.move_up()  # move_up already checks on_ground internally
 
-        super().update(dt)  # runs physics + sprite animation
+        super().update(dt)  # GameState.update() advances the animation, the PhysicsWorld moves the body
         
@@ -1,42 +1,115 @@
+import weakref
+
+from managers.physics_world import PhysicsWorld, BodyVector
+
+
 class PhysicsComponent:
     def __init__(self, gravity=1180, ground_y=400, jump_speed=400, walk_speed=100):
         """
         Initialize physics component with millisecond-based values.
+        The body (position, velocity, gravity, ground, on_ground) lives in the PhysicsWorld,
+        this component is a view onto it and is stepped with all other bodies once per tick.
         Args:
             gravity: Pixels per millisecond squared (default: 0.0005)
             ground_y: Y position of the ground (default: 120)
             jump_speed: Initial upward speed in pixels/ms (default: 0.1)
         """
-        self.owner = None # will be set by add_physics methode from game_object
-        self.gravity = gravity
-        self.ground_y = ground_y
+        self._owner = None # weak reference to the owner, set by add_physics methode from game_object
+        self.world: PhysicsWorld = PhysicsWorld()
+        self.body = None # index in the PhysicsWorld, set by attach()
+        self._position = None # BodyVector views of the body, created once in attach()
+        self._velocity = None
         self.jump_speed = jump_speed
         self.walk_speed = walk_speed
-        self.on_ground = False
-        
-    def update(self, dt):
-        # Apply gravity and update position
-        self.owner.vel.y += self.gravity * dt
-        self.owner.world_pos.y += self.owner.vel.y * dt
-        self.owner.world_pos.x += self.owner.vel.x * dt
-        
-        # Ground collision
-        if self.owner.world_pos.y >= self.ground_y:
-            self.owner.world_pos.y = self.ground_y
-            self.owner.vel.y = 0
-            self.on_ground = True
+        self._gravity = gravity     # until attached
+        self._ground_y = ground_y
+        self._on_ground = False
+        self._active = True
+
+    def attach(self, owner):
+        """Add the body of `owner` (its current world_pos and vel) to the PhysicsWorld."""
+        self._owner = weakref.ref(owner)  # no owner <-> physics cycle, the owner is freed without gc
+        self.body = self.world.add(owner.world_pos, owner.vel, self._gravity, self._ground_y, self)
+        self._position = BodyVector(self.world, "pos", self.body)
+        self._velocity = BodyVector(self.world, "vel", self.body)
+        self.world.on_ground[self.body] = self._on_ground
+        self.world.active[self.body] = self._active
+
+    def release(self):
+        """Remove the body from the PhysicsWorld (owner is discarded)."""
+        if self.body is not None:
+            self._on_ground, self._active = self.on_ground, self.active
+            self.world.remove(self.body)
+            self.body = None
+            self._position = self._velocity = None
+
+    def detach(self):
+        """Leave the PhysicsWorld, the owner takes its position and velocity back (PhysicsWorld.clear())."""
+        owner = self.owner
+        if owner is not None and owner.physics is self:
+            owner.remove_physics()
         else:
-            self.on_ground = False
+            self.release()
+
+    @property
+    def owner(self):
+        """The GameObject this component is attached to (None if not attached or already freed)."""
+        return self._owner() if self._owner is not None else None
+
+    # --- views onto the PhysicsWorld ---
+    @property
+    def position(self) -> BodyVector:
+        return self._position
+
+    @property
+    def velocity(self) -> BodyVector:
+        return self._velocity
+
+    @property
+    def gravity(self) -> float:
+        return float(self.world.gravity[self.body]) if self.body is not None else self._gravity
+
+    @gravity.setter
+    def gravity(self, value: float):
+        self._gravity = value
+        if self.body is not None:
+            self.world.gravity[self.body] = value
+
+    @property
+    def ground_y(self) -> float:
+        return float(self.world.ground_y[self.body]) if self.body is not None else self._ground_y
+
+    @ground_y.setter
+    def ground_y(self, value: float):
+        self._ground_y = value
+        if self.body is not None:
+            self.world.ground_y[self.body] = value
+
+    @property
+    def on_ground(self) -> bool:
+        return bool(self.world.on_ground[self.body]) if self.body is not None else self._on_ground
+
+    @on_ground.setter
+    def on_ground(self, value: bool):
+        self._on_ground = value
+        if self.body is not None:
+            self.world.on_ground[self.body] = value
+
+    @property
+    def active(self) -> bool:
+        """Whether PhysicsWorld.step() moves this body."""
+        return bool(self.world.active[self.body]) if self.body is not None else self._active
 
-  
+    @active.setter
+    def active(self, value: bool):
+        self._active = value
+        if self.body is not None:
+            self.world.active[self.body] = value
 
-        # set horizontal velocity to 0 if no left/right input (friction)
-        #self.owner.vel.x *= 0.8  # simple friction effect
-            
     def move_up(self):
         """Apply jump force if on ground."""
-        if self.on_ground:
-            self.owner.vel.y = -self.jump_speed
+        if self.body is not None and self.on_ground:
+            self.world.vel[self.body, 1] = -self.jump_speed
             self.on_ground = False
 
 class FighterPhysicsComponent(PhysicsComponent):
@@ -46,13 +119,13 @@ class FighterPhysicsComponent(PhysicsComponent):
 
     def move_left(self):
         # Implement left movement logic (e.g., set horizontal velocity)
-        if self.on_ground:
-            self.owner.vel.x = -self.walk_speed  # Use walk_speed for horizontal movement
+        if self.body is not None and self.on_ground:
+            self.world.vel[self.body, 0] = -self.walk_speed  # Use walk_speed for horizontal movement
 
     def move_right(self):
         # Implement right movement logic (e.g., set horizontal velocity)
-        if self.on_ground:
-            self.owner.vel.x = self.walk_speed  # Use walk_speed for horizontal movement
+        if self.body is not None and self.on_ground:
+            self.world.vel[self.body, 0] = self.walk_speed  # Use walk_speed for horizontal movement
 
     def move_down(self):
         # Implement down movement logic if needed
@@ -60,8 +133,8 @@ class FighterPhysicsComponent(PhysicsComponent):
 
     def stop(self):
         # Stop horizontal movement (e.g., when no left/right input)
-        if self.on_ground:
-            self.owner.vel.x = 0
+        if self.body is not None and self.on_ground:
+            self.world.vel[self.body, 0] = 0
 
     
 
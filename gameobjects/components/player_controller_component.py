@@ -2,6 +2,7 @@ from gameobjects.game_object import GameObject
 from managers.input_manager import InputManager, Action
 from collections import deque
 import time
+import weakref
 from typing import Optional, Dict, List
 
 # --- PlayerController ---
@@ -10,7 +11,7 @@ class PlayerController:
         """player_index 0 = player 1, player_index 1 = player 2"""
         self.player_index = player_index
         self.input_manager = InputManager()
-        self.owner = owner
+        self._owner = weakref.ref(owner)  # no owner <-> controller cycle, the fighter is freed without gc
         self.specialmovelist: Dict[str, List[Action]] = {} 
         
         # Current frame actions
@@ -34,6 +35,11 @@ class PlayerController:
             frozenset({Action.UP, Action.LEFT}): Action.UP_LEFT,
         }
 
+    @property
+    def owner(self) -> Optional[GameObject]:
+        """The fighter this controller belongs to (None once it was freed)."""
+        return self._owner()
+
     def normalize_diagonals(self, actions: frozenset[Action]) -> frozenset[Action]:
         """Convert cardinal direction combinations into diagonal actions."""
         new_actions = set(actions)
@@ -55,9 +55,9 @@ class GameObject(Sprite):
         super().__init__()
 
         self.anchor = render_anchor
-        self.world_pos = pygame.Vector2(world_pos)
-        self.on_ground = None
-        self.vel = pygame.Vector2(0, 0) #TODO: should might be in the physics component
+        self._world_pos = pygame.Vector2(world_pos)
+        self.prev_world_pos = pygame.Vector2(world_pos) # world_pos at the start of the current tick, for render interpolation
+        self._vel = pygame.Vector2(0, 0)
 
         # Camera
         self._use_camera = False
@@ -74,10 +74,45 @@ class GameObject(Sprite):
     # Components
     # ------------------------
     def add_physics(self, physics_component):
+        """Attach `physics_component`; from now on world_pos and vel are views onto its PhysicsWorld body."""
+        physics_component.attach(self)
         self.physics = physics_component
-        physics_component.owner = self
         return self
 
+    def remove_physics(self):
+        """Take world_pos and vel back from the PhysicsWorld and free the body."""
+        if self.physics:
+            self._world_pos.update(self.physics.position)
+            self._vel.update(self.physics.velocity)
+            self.physics.release()
+            self.physics = None
+        return self
+
+    @property
+    def world_pos(self):
+        return self.physics.position if self.physics else self._world_pos
+
+    @world_pos.setter
+    def world_pos(self, value):
+        self.world_pos.update(value)
+
+    @property
+    def vel(self):
+        return self.physics.velocity if self.physics else self._vel
+
+    @vel.setter
+    def vel(self, value):
+        self.vel.update(value)
+
+    @property
+    def on_ground(self) -> bool | None:
+        return self.physics.on_ground if self.physics else None
+
+    @property
+    def uses_camera(self) -> bool:
+        """True if world_pos is projected through the camera when drawn."""
+        return self._use_camera
+
     def enable_camera(self):
         self._use_camera = True
         return self
@@ -90,39 +125,64 @@ class GameObject(Sprite):
     # Update
     # ------------------------
     def update(self, dt):
-        if not self.active:
-            return
-
-        if self.physics:
-            self.physics.update(dt)
-            self.on_ground = self.physics.on_ground
-
-        super().update(dt)
+        self.prev_world_pos.update(self.world_pos)
+        # the animation is advanced by GameState.update() for all objects at once (sprite.advance_all),
+        # physics bodies are moved by PhysicsWorld.step() after all objects are updated
 
     # ------------------------
     # Draw
     # ------------------------
-    def draw(self):
+    def draw(self, screen_pos=None):
+        """Draw at `screen_pos`, or at world_pos projected through the camera if None (see GameState.draw_objects)."""
         if not self.visible:
             return
-        screen_pos = self._vm.camera.apply_vec2(self.world_pos, self.shake_factor) if self._use_camera else self.world_pos
+        if screen_pos is None:
+            screen_pos = self._screen_pos(self.shake_factor)
+        if self._vm.culling and not self._vm.is_on_screen(self.get_bounds(screen_pos, self.anchor), self._use_camera):
+            self._vm.cull_stats["culled"] += 1
+            return
+        self._vm.cull_stats["drawn"] += 1
         super().draw(screen_pos, self.anchor)
 
+    def get_screen_blit(self):
+        """(frame, top left on screen, palette) that draw() would submit, or None if nothing is drawn."""
+        if not self.visible:
+            return None
+        return super().get_blit(self._screen_pos(self.shake_factor), self.anchor)
+
     # ------------------------
     # Debug drawing
     # ------------------------
     def debug_draw(self):
-        screen_pos = self._vm.camera.apply_vec2(self.world_pos) if self._use_camera else self.world_pos
+        screen_pos = self._screen_pos()
+        if self._vm.cull_debug_draw and not self._vm.is_on_screen(self.get_bounds(screen_pos, self.anchor), self._use_camera):
+            return
         super().debug_draw(screen_pos, self.anchor)
 
-        for rect, _ in self.get_active_hitboxes():
+        render_pos = self.get_render_pos() # boxes follow the drawn (interpolated) sprite
+        for rect, _ in self.get_active_hitboxes(render_pos):
             screen_rect = self._vm.camera.apply(rect) if self._use_camera else rect
             self._vm.draw_rect_outline(screen_rect.x, screen_rect.y, screen_rect.width, screen_rect.height, globals.COLOR_RED)
 
-        for rect, _ in self.get_active_hurtboxes():
+        for rect, _ in self.get_active_hurtboxes(render_pos):
             screen_rect = self._vm.camera.apply(rect) if self._use_camera else rect
             self._vm.draw_rect_outline(screen_rect.x, screen_rect.y, screen_rect.width, screen_rect.height, globals.COLOR_GREEN)
 
+    def get_render_pos(self) -> tuple:
+        """world_pos interpolated between the previous and the current tick (ViewManager.interpolation_alpha)."""
+        alpha = self._vm.interpolation_alpha
+        x, y = self.world_pos
+        if alpha >= 1.0:
+            return x, y
+        px, py = self.prev_world_pos
+        return px + (x - px) * alpha, py + (y - py) * alpha
+
+    def _screen_pos(self, shake_factor: float = 1.0):
+        x, y = self.get_render_pos()
+        if self._use_camera:
+            return self._vm.camera.apply_xy(x, y, shake_factor)
+        return x, y
+
     # ------------------------
     # Hitboxes / Hurtboxes
     # ------------------------
@@ -136,24 +196,26 @@ class GameObject(Sprite):
         """Add a hurtbox. rect is relative to world_pos."""
         self.hurtboxes.append(HurtboxData(rect.copy(), hurtbox_type, base_name, tag_name, frame))
 
-    def get_active_hitboxes(self) -> list[tuple[pygame.Rect, HitboxType]]:
-        """Get all active hitboxes in world space."""
+    def get_active_hitboxes(self, pos=None) -> list[tuple[pygame.Rect, HitboxType]]:
+        """Get all active hitboxes in world space, placed at `pos` (default world_pos)."""
         if not self.hitboxes:
             return []
         tag_name = self.current_tag["name"] if self.current_tag else None
+        pos = self.world_pos if pos is None else pos
         return [
-            (hb.rect.move(self.world_pos), hb.hitbox_type)
+            (hb.rect.move(pos), hb.hitbox_type)
             for hb in self.hitboxes
             if hb.is_active(self.base_name, tag_name, self.current_frame_idx)
         ]
 
-    def get_active_hurtboxes(self) -> list[tuple[pygame.Rect, HurtboxType]]:
-        """Get all active hurtboxes in world space."""
+    def get_active_hurtboxes(self, pos=None) -> list[tuple[pygame.Rect, HurtboxType]]:
+        """Get all active hurtboxes in world space, placed at `pos` (default world_pos)."""
         if not self.hurtboxes:
             return []
         tag_name = self.current_tag["name"] if self.current_tag else None
+        pos = self.world_pos if pos is None else pos
         return [
-            (hb.rect.move(self.world_pos), hb.hurtbox_type)
+            (hb.rect.move(pos), hb.hurtbox_type)
             for hb in self.hurtboxes
             if hb.is_active(self.base_name, tag_name, self.current_frame_idx)
         ]
\ No newline at end of file
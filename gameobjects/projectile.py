@@ -0,0 +1,101 @@
+import math
+from gameobjects.game_object import GameObject
+from managers.view_manager.view_manager import ViewManager
+
+
+class Projectile(GameObject):
+    """A GameObject that flies in a straight line. Owned by a ProjectilePool, reused instead of reallocated."""
+
+    def __init__(self):
+        super().__init__((0, 0))
+        self.enable_camera()
+        self.lifetime = math.inf  # seconds left, despawned at 0
+        self.pool_index = -1      # position in ProjectilePool.active, -1 = not spawned
+
+    def update(self, dt):
+        super().update(dt)
+        # in place, no Vector2 per projectile and tick
+        self.world_pos.x += self.vel.x * dt
+        self.world_pos.y += self.vel.y * dt
+        self.lifetime -= dt
+
+
+class ProjectilePool:
+    """
+    Preallocated projectiles of one character. spawn() takes a free object, despawn() swap-removes
+    it from `active` in O(1). Projectiles are despawned automatically when their lifetime is over or
+    they leave the stage (Camera.world_rect grown by `despawn_margin`).
+    """
+
+    def __init__(self, max_active: int = 8, despawn_margin: int = 64):
+        self.max_active = max_active          # cap of projectiles on screen at once, spawn() fails above
+        self.despawn_margin = despawn_margin  # px outside the stage before a projectile is despawned
+        self.active: list[Projectile] = []    # spawned projectiles, in no particular order
+        self._free: list[Projectile] = [Projectile() for _ in range(max_active)]
+        self._camera = ViewManager().camera
+
+    def spawn(self, anim_name: str, world_pos, vel, tag: str | None = None, scale: int | None = None,
+              flip_x: bool = False, lifetime: float = math.inf) -> Projectile | None:
+        """
+        Launch a projectile, or return None if `max_active` are already on screen.
+        `scale` None keeps the projectile's current scale.
+        """
+        if not self._free:
+            return None
+        projectile = self._free.pop()
+        projectile.set_anim_name(anim_name)
+        if tag:
+            projectile.set_frame_tag(tag)
+        else:
+            projectile.current_tag = None  # whole animation, not the tag of its previous use
+        if scale is not None:
+            projectile.set_scale(scale)
+        projectile.restart()
+        projectile.flip_x = flip_x
+        projectile.world_pos.update(world_pos)
+        projectile.prev_world_pos.update(world_pos)  # no interpolation from where it was last used
+        projectile.vel.update(vel)
+        projectile.lifetime = lifetime
+        projectile.pool_index = len(self.active)
+        self.active.append(projectile)
+        return projectile
+
+    def despawn(self, projectile: Projectile):
+        """Remove `projectile` from `active`: the last one takes its slot."""
+        index = projectile.pool_index
+        if index < 0 or index >= len(self.active) or self.active[index] is not projectile:
+            raise ValueError("Projectile is not spawned by this pool.")
+        last = self.active.pop()
+        if last is not projectile:
+            self.active[index] = last
+            last.pool_index = index
+        projectile.pool_index = -1
+        self._free.append(projectile)
+
+    def update(self, dt):
+        """Update all projectiles, despawn expired and off-stage ones."""
+        bounds = self._camera.world_rect
+        cull = bounds.width > 0 and bounds.height > 0  # no stage configured yet
+        bounds.inflate_ip(self.despawn_margin * 2, self.despawn_margin * 2)
+
+        # backwards: despawn() moves the last projectile (already updated) into the freed slot
+        for i in range(len(self.active) - 1, -1, -1):
+            projectile = self.active[i]
+            projectile.update(dt)
+            if projectile.lifetime <= 0 or (cull and not bounds.collidepoint(projectile.world_pos)):
+                self.despawn(projectile)
+
+    def clear(self):
+        """Despawn everything and drop the animations of all pooled objects (state change), the objects are kept."""
+        for projectile in self.active:
+            projectile.pool_index = -1
+            self._free.append(projectile)
+        self.active = []
+        for projectile in self._free:
+            projectile.clear_anim()
+
+    def __len__(self):
+        return len(self.active)
+
+    def __iter__(self):
+        return iter(self.active)
@@ -1,7 +1,10 @@
+import math
 import pygame
+from bisect import bisect_right
+import numpy as np
 from managers.graphic_manager import GraphicManager
 from managers.debug_manager import DebugManager
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
 
 from managers.view_manager.view_manager import ViewManager
 
@@ -10,10 +13,59 @@ class RenderAnchor(Enum):
     TOPLEFT = auto()
     BOTTOMCENTER = auto()
 
+class RenderLayer(IntEnum):
+    """Draw order of the ViewManager render queue, lower layers are drawn first."""
+    STAGE = 0
+    OBJECTS = 10
+    FIGHTERS = 20
+    HUD = 30
+
+def advance_all(sprites, dt: float):
+    """
+    Advance the animation of every sprite in `sprites` (same result as calling update(dt) on each).
+    Sprites playing the same tag share one Timeline, each group is stepped in one NumPy pass over it.
+    """
+    ms = dt * 1000.0
+    groups = {}  # id(timeline) -> (timeline, [sprites])
+    for sprite in sprites:
+        if sprite.active and sprite.frames and not sprite.png:
+            timeline = sprite._anim.get_timeline(sprite.current_tag)
+            groups.setdefault(id(timeline), (timeline, []))[1].append(sprite)
+
+    for timeline, group in groups.values():
+        if timeline.length <= 0:
+            for sprite in group:
+                sprite.timer += ms
+            continue
+        durations, starts, ends = timeline.arrays
+        pos = np.fromiter((sprite._timeline_pos for sprite in group), np.intp, len(group))
+        timer = np.fromiter((sprite.timer for sprite in group), np.float64, len(group)) + ms
+
+        # same steps as Sprite._advance: subtract one duration, bisect only on a hitch
+        moved = timer >= durations[pos]
+        timer[moved] -= durations[pos[moved]]
+        pos[moved] = (pos[moved] + 1) % len(durations)
+        hitch = moved & (timer >= durations[pos])
+        elapsed = (starts[pos[hitch]] + timer[hitch]) % timeline.length
+        pos[hitch] = np.searchsorted(ends, elapsed, side="right")
+        timer[hitch] = elapsed - starts[pos[hitch]]
+
+        for sprite, new_pos, new_timer, changed in zip(group, pos.tolist(), timer.tolist(), moved.tolist()):
+            sprite.timer = new_timer
+            if changed:
+                sprite._timeline_pos = new_pos
+                sprite.current_frame_idx = timeline.frames[new_pos]
+                sprite._current_offset = timeline.offsets[new_pos]
+
+
 class Sprite:
-    def __init__(self, scale: int = 1):
+    def __init__(self, scale: int | None = None):
+        self._vm: ViewManager = ViewManager()
+
         #PUBLIC attributes
-        self.scale = scale
+        # None = the smallest scale the render target draws (1, or render_scale with low-res rendering)
+        self.scale = scale if scale is not None else self._vm.render_scale
+        self._vm.check_scale(self.scale) # low-res rendering draws whole multiples of the render scale only
 
         # PUBLIC attributes (with property access)
         self._flip_x: bool = False
@@ -25,25 +77,30 @@ class Sprite:
         self.base_name = None # is a str name of the current animation-file
         self.current_tag = None # is a str name of the current tag
         self.current_frame_idx = 0 # is an int index of the current frame within the animation for this sprite
-        self.timer = 0
+        self.timer = 0 # ms the current frame has been shown
         self.active = False # wheter or not sprite gets updated/animated
         self.visible = True # wheter or not sprite gets drawn
+        self.layer = RenderLayer.OBJECTS # draw order in the ViewManager render queue
         self.png = None # True if this sprite is a single PNG, False if it is an animation
+        self.palette = None # name of the palette (see GraphicManager.make_palette) for indexed sheets, None = own colors
 
         # Animation data - readonly (references to ResourceManager data, do NOT modify these!)
         self.frames = None  # is a Dict[int, pygame.Surface], reference, do NOT modify!
         self.frame_durations = None  # is a Dict[int, int] mapping frame index to duration in ms, reference, do NOT modify!
         self.tags = None  # is a Dict[str, Dict[str, int]] mapping tag name to {"from": int, "to": int}, reference, do NOT modify!
         self.final_offsets = None  # is a Dict[int, (x, y)], reference, do NOT modify!
+        self.trim_offsets = None  # is a Dict[int, (x, y)] part of final_offsets that comes from trimming, reference, do NOT modify!
 
         # Private attributes
         self._gm: GraphicManager = GraphicManager()
         self._dm: DebugManager = DebugManager()
-        self._vm: ViewManager = ViewManager()
-        self._draw_surface = self._vm.game_surface # surface to draw on
         self._snapped_rotation: int = 0
         self._current_offset = (0, 0) # current frame offset, updated in update() if frame changes
+        self._timeline_pos = 0 # position of the current frame in the current timeline (AnimationData.get_timeline)
         self._draw_rect = pygame.Rect(0, 0, 0, 0)
+        self._bounds_rect = pygame.Rect(0, 0, 0, 0)
+        self._anim = None # AnimationData currently in use, registered in its users set
+        self._palette_colors = None # colors set on the frame before each blit (indexed sheets only)
         
     # ---------------------
     # Properties
@@ -66,6 +123,11 @@ class Sprite:
     def flip_y(self, value: bool):
         self._flip_y = bool(value)
 
+    @property
+    def screen_size(self) -> tuple:
+        """Untrimmed frame size in game surface pixels (sprite_size is in render surface pixels)."""
+        return (self.sprite_size[0] * self._vm.render_scale, self.sprite_size[1] * self._vm.render_scale)
+
     @property
     def rotation(self) -> int:
         return self._rotation
@@ -82,18 +144,22 @@ class Sprite:
     def set_anim_name(self, name: str):
         if name != self.base_name:
             # Load new animation data from ResourceManager
-            anim = self._gm.get_animationdata_reference(name, self.scale)
+            anim = self._gm.get_animationdata_reference(name, self._vm.asset_scale(self.scale))
+            self._use_anim(anim)
             self.frames = anim.frames
             self.frame_durations = anim.durations
             self.tags = anim.tags
             self.final_offsets = anim.final_offsets
+            self.trim_offsets = anim.trim_offsets
             self.sprite_size = anim.sprite_size
             self.base_name = name
             self.current_tag = None
             self.current_frame_idx = 0
             self.timer = 0
+            self._timeline_pos = 0
             self.active = True
             self.png = anim.png
+            self._resolve_palette()
             self._current_offset = self.final_offsets.get(0, (0, 0)) #get offset for first frame, if there is none get (0,0)
         return self # allow chaining
         
@@ -106,19 +172,54 @@ class Sprite:
             tag_data = self.tags[tag_name]
             self.current_tag = tag_name
             self.current_frame_idx = tag_data["from"]
+            self._current_offset = self.final_offsets.get(self.current_frame_idx, (0, 0))
             self.timer = 0
+            self._timeline_pos = 0
             self.active = True
         return self
 
+    def clear_anim(self):
+        """Stop using the current animation (GraphicManager may unload it), set_anim_name() loads one again."""
+        if self._anim is not None:
+            self._anim.users.discard(self)
+            self._anim = None
+        self.frames = self.frame_durations = self.tags = self.final_offsets = self.trim_offsets = None
+        self.sprite_size = (0, 0)
+        self.base_name = None
+        self.current_tag = None
+        self.active = False
+        return self
+
+    def restart(self):
+        """Play the current tag (or the whole sheet) from its first frame."""
+        self.current_frame_idx = self.tags[self.current_tag]["from"] if self.current_tag else 0
+        self._current_offset = self.final_offsets.get(self.current_frame_idx, (0, 0))
+        self.timer = 0
+        self._timeline_pos = 0
+        self.active = True
+        return self
+
     def set_frame(self, frame_index: int):
         """Set animation to specific frame."""
         if 0 <= frame_index < len(self.frames):
             self.current_tag = None
             self.current_frame_idx = frame_index
+            self._current_offset = self.final_offsets.get(self.current_frame_idx, (0, 0))
             self.timer = 0
+            self._timeline_pos = frame_index # resumes here if activated again
             self.active = False
         return self
     
+    def set_palette(self, palette_name: str | None):
+        """
+        Draw an indexed sheet with the colors of palette `palette_name` (None = the sheet's own colors).
+        All sprites still share the same 8-bit pixels, only the palette differs.
+        """
+        self.palette = palette_name
+        if self._anim is not None:
+            self._resolve_palette()
+        return self
+
     def set_scale(self, scale: int):
         """
         Switch to a different scale of the current animation.
@@ -131,21 +232,26 @@ class Sprite:
             raise ValueError(f"Scale factor must be >= 1, got {scale}.")
         if scale == self.scale:
             return self  # nothing to do
+        self._vm.check_scale(scale) # low-res rendering draws whole multiples of the render scale only
 
-        # Create the scaled variant if it doesn't exist yet
-        self._gm.get_or_create_scaled(self.base_name, scale)
+        # Create the scaled variant if it doesn't exist yet (low-res rendering uses a smaller asset)
+        asset_scale = self._vm.asset_scale(scale)
+        self._gm.get_or_create_scaled(self.base_name, asset_scale)
 
         # Switch scale and re-point all references
         saved_tag = self.current_tag
         self.scale = scale
 
-        anim = self._gm.get_animationdata_reference(self.base_name, self.scale)
+        anim = self._gm.get_animationdata_reference(self.base_name, asset_scale)
+        self._use_anim(anim)
         self.frames = anim.frames
         self.frame_durations = anim.durations
         self.tags = anim.tags
         self.final_offsets = anim.final_offsets
+        self.trim_offsets = anim.trim_offsets
         self.sprite_size = anim.sprite_size
         self.png = anim.png
+        self._resolve_palette()
         self._current_offset = self.final_offsets.get(self.current_frame_idx, (0, 0))
 
         # Restore tag if it still exists
@@ -161,38 +267,41 @@ class Sprite:
         """Update current animation frame."""
         if not self.active or not self.frames or self.png:
             return
-
-        self.timer += dt * 1000.0  # Convert dt to milliseconds
-        current_frame_duration = self.frame_durations.get(self.current_frame_idx, 100)  # default to 100ms if not specified
-
-        while self.timer >= current_frame_duration:
-            self.timer -= current_frame_duration
-            self.current_frame_idx += 1
-
-            # Check for tag boundaries
-            if self.current_tag:
-                tag_data = self.tags[self.current_tag]
-                if self.current_frame_idx > tag_data["to"]:
-                    self.current_frame_idx = tag_data["from"]
-            else:
-                # Loop back to start if we exceed available frames
-                if self.current_frame_idx >= len(self.frames):
-                    self.current_frame_idx = 0
-
-            # Update current offset property for the current frame, if there is none default to (0,0)        
-            self._current_offset = self.final_offsets.get(self.current_frame_idx, (0, 0))
-
-            # Update current frame duration for the current frame, if there is none default to 100ms
-            current_frame_duration = self.frame_durations.get(self.current_frame_idx, 100)
+        self._advance(dt * 1000.0)  # Convert dt to milliseconds
 
     def draw(self, screen_pos, render_anchor: RenderAnchor = RenderAnchor.CENTER):
+        blit = self.get_blit(screen_pos, render_anchor)
+        if blit is None:
+            return
+        # shared indexed frames: the queue sets this sprite's colors right before blitting
+        self._vm.submit(blit[0], blit[1], self.layer, blit[2])
+
+    def get_blit(self, screen_pos, render_anchor: RenderAnchor = RenderAnchor.CENTER):
+        """(frame, top left, palette) that draw() would submit, or None if nothing is drawn."""
 
         # if there are no frames or sprite size is (0,0), skip drawing to avoid errors
         if not self.frames or self.sprite_size == (0, 0) or not self.visible:
-            return
+            return None
 
         x, y = screen_pos
+        if self._vm.render_scale != 1:
+            # screen positions are game surface pixels, frames and offsets are render surface pixels
+            x /= self._vm.render_scale
+            y /= self._vm.render_scale
+
+        if not self._snapped_rotation:
+            # --- Placement --- anchor, offset and flip are constant per frame, see _placement()
+            key = (self.current_frame_idx, render_anchor, self._flip_x, self._flip_y)
+            shift_x, shift_y, half_w, half_h = self._anim.placements.get(key) or self._placement(key)
+            if self._rotation == 0 and not self._flip_x and not self._flip_y:
+                frame = self.frames[self.current_frame_idx]
+            else:
+                frame = self._get_transformed_frame()
+            self._draw_rect.topleft = (x + shift_x, y + shift_y)  # whole pixels, rounded like Rect.center
+            left, top = self._draw_rect.topleft
+            return frame, (left - half_w, top - half_h), self._palette_colors
 
+        # rotated: the frame size depends on the angle, the placement is worked out per call
         # --- Anchor adjustment ---
         if render_anchor == RenderAnchor.TOPLEFT:
             x += self.sprite_size[0] // 2
@@ -212,20 +321,46 @@ class Sprite:
         x += offset_x
         y += offset_y
 
-        
+        # A trimmed frame is off-center, its shift has to rotate with it
+        if self.trim_offsets:
+            x, y = self._rotate_trim_offset(x, y)
 
-        # --- Get frame ---
-        if self._rotation == 0 and not self._flip_x and not self._flip_y:
-            frame = self.frames[self.current_frame_idx]
-        else:
-            # get transformed frame from ResourceManager cache (handles rotation and flipping)
-            frame = self._get_transformed_frame()
+        # get transformed frame from ResourceManager cache (handles rotation and flipping)
+        frame = self._get_transformed_frame()
 
         self._draw_rect.size = frame.get_size()
         self._draw_rect.center = (x, y)
+        return frame, self._draw_rect.topleft, self._palette_colors
+
 
-        self._draw_surface.blit(frame, self._draw_rect)
+    def get_bounds(self, screen_pos, render_anchor: RenderAnchor = RenderAnchor.CENTER) -> pygame.Rect:
+        """
+        Screen rect the sprite can cover: the untrimmed frame box with anchor and offsets applied,
+        grown to its diagonal when rotated. Cheap (no frame lookup), meant for culling.
+        """
+        x, y = screen_pos
+        rs = self._vm.render_scale  # sizes and offsets are render surface pixels
+        w, h = self.sprite_size[0] * rs, self.sprite_size[1] * rs
+        if render_anchor == RenderAnchor.TOPLEFT:
+            x += w // 2
+            y += h // 2
+        elif render_anchor == RenderAnchor.BOTTOMCENTER:
+            y -= h // 2
 
+        offset_x, offset_y = self._current_offset
+        if self.trim_offsets:
+            trim_x, trim_y = self.trim_offsets.get(self.current_frame_idx, (0, 0))
+            offset_x -= trim_x
+            offset_y -= trim_y
+        offset_x, offset_y = offset_x * rs, offset_y * rs
+        x += -offset_x if self._flip_x else offset_x
+        y += -offset_y if self._flip_y else offset_y
+
+        if self._snapped_rotation:
+            w = h = math.ceil(math.hypot(w, h)) + 2  # rotation keeps the center, the frame stays within the diagonal
+        self._bounds_rect.size = (w, h)
+        self._bounds_rect.center = (x, y)
+        return self._bounds_rect
 
     # ---------------------
     # Debug Draw
@@ -234,14 +369,16 @@ class Sprite:
     def debug_draw(self, screen_pos: pygame.Vector2, render_anchor: RenderAnchor = RenderAnchor.CENTER):
      
         x, y = screen_pos
+        rs = self._vm.render_scale  # sizes and offsets are render surface pixels, debug drawing is not
+        sprite_w, sprite_h = self.sprite_size[0] * rs, self.sprite_size[1] * rs
 
         # --- Anchor adjustment --- but only if sprite size is not (0,0) to avoid weird anchor behavior when there is no sprite loaded yet
         if self.sprite_size != (0, 0):
             if render_anchor == RenderAnchor.TOPLEFT:
-                x += self.sprite_size[0] // 2
-                y += self.sprite_size[1] // 2
+                x += sprite_w // 2
+                y += sprite_h // 2
             elif render_anchor == RenderAnchor.BOTTOMCENTER:
-                y -= self.sprite_size[1] // 2
+                y -= sprite_h // 2
 
         # starting here x and y are the world position of the sprite with anchor adjustment, but before offset and camera
 
@@ -254,13 +391,20 @@ class Sprite:
         if self._flip_y:
             offset_y = -offset_y
 
+        # the sprite rect is the untrimmed frame
+        if self.trim_offsets:
+            trim_x, trim_y = self.trim_offsets.get(self.current_frame_idx, (0, 0))
+            offset_x -= -trim_x if self._flip_x else trim_x
+            offset_y -= -trim_y if self._flip_y else trim_y
+
+        offset_x, offset_y = offset_x * rs, offset_y * rs
 
         # Draw the original sprite rect (with offset) for debugging
         self._vm.draw_rect_outline(
-            x + offset_x - self.sprite_size[0] // 2,
-            y + offset_y - self.sprite_size[1] // 2,
-            width=self.sprite_size[0],
-            height=self.sprite_size[1],
+            x + offset_x - sprite_w // 2,
+            y + offset_y - sprite_h // 2,
+            width=sprite_w,
+            height=sprite_h,
             color=(247, 0, 255)
             )
 
@@ -279,8 +423,8 @@ class Sprite:
         # Draw text with screen position and current tag for debugging
         if self._dm.debug_text:
             self._dm.draw_debug_text(
-                x + offset_x - self.sprite_size[0] // 2,
-                y + offset_y - self.sprite_size[1] // 2 - 10,
+                x + offset_x - sprite_w // 2,
+                y + offset_y - sprite_h // 2 - 10,
                 text=f"screen_pos: {screen_pos}, tag: {self.current_tag}, frame: {self.current_frame_idx}",
                 color=(247, 0, 255)
             )
@@ -291,6 +435,80 @@ class Sprite:
     # ---------------------
     # Private helpers
     # ---------------------
+    def _advance(self, ms: float):
+        """
+        Move `ms` forward in the current tag's timeline. A step into the next frame subtracts its
+        duration, a longer step (hitch) finds the frame with one bisect instead of walking frame by frame.
+        """
+        timeline = self._anim.get_timeline(self.current_tag)
+        pos = self._timeline_pos
+        self.timer += ms
+        if self.timer < timeline.durations[pos] or timeline.length <= 0:
+            return
+
+        self.timer -= timeline.durations[pos]
+        pos = pos + 1 if pos + 1 < len(timeline.frames) else 0
+        if self.timer >= timeline.durations[pos]:
+            elapsed = (timeline.start(pos) + self.timer) % timeline.length
+            pos = bisect_right(timeline.ends, elapsed)
+            self.timer = elapsed - timeline.start(pos)
+
+        self._timeline_pos = pos
+        self.current_frame_idx = timeline.frames[pos]
+        self._current_offset = timeline.offsets[pos]
+
+    def _use_anim(self, anim):
+        """Register this sprite as user of `anim` so GraphicManager does not unload it."""
+        if self._anim is not None:
+            self._anim.users.discard(self)
+        anim.users.add(self)
+        self._anim = anim
+
+    def _resolve_palette(self):
+        if self.palette is not None and self._anim.palette is None:
+            raise ValueError(f"Animation '{self.base_name}' is not indexed, it has no palette to swap.")
+        self._palette_colors = self._gm.get_palette(self.palette) if self.palette is not None else self._anim.palette
+
+    def _placement(self, key):
+        """
+        Placement of `key` = (frame_idx, anchor, flip_x, flip_y): the whole-pixel shift of the frame
+        center from screen_pos (anchor + signed offset) and half the frame size, cached in AnimationData.placements.
+        """
+        frame_idx, render_anchor, flip_x, flip_y = key
+        shift_x, shift_y = self._anim.final_offsets.get(frame_idx, (0, 0))
+        if flip_x:
+            shift_x = -shift_x
+        if flip_y:
+            shift_y = -shift_y
+
+        sprite_w, sprite_h = self._anim.sprite_size
+        if render_anchor == RenderAnchor.TOPLEFT:
+            shift_x += sprite_w // 2
+            shift_y += sprite_h // 2
+        elif render_anchor == RenderAnchor.BOTTOMCENTER:
+            shift_y -= sprite_h // 2
+
+        width, height = self.frames[frame_idx].get_size()  # flipping keeps the size
+        placement = self._anim.placements[key] = (shift_x, shift_y, width // 2, height // 2)
+        return placement
+
+    def _rotate_trim_offset(self, x, y):
+        """Move the center of a rotated trimmed frame to where the untrimmed frame would put it."""
+        trim_x, trim_y = self.trim_offsets.get(self.current_frame_idx, (0, 0))
+        if self._flip_x:
+            trim_x = -trim_x
+        if self._flip_y:
+            trim_y = -trim_y
+        if self._snapped_rotation % 90:
+            # rotated in the untrimmed box (GraphicManager._rotates_untrimmed()), centered like an untrimmed frame
+            return x - trim_x, y - trim_y
+        # right angles: pygame rotates counterclockwise, screen y points down
+        angle = math.radians(self._snapped_rotation)
+        cos_a, sin_a = math.cos(angle), math.sin(angle)
+        x += round(trim_x * cos_a + trim_y * sin_a) - trim_x
+        y += round(-trim_x * sin_a + trim_y * cos_a) - trim_y
+        return x, y
+
     def _get_transformed_frame(self) -> pygame.Surface | None:
         """Get current animation frame with rotation/flip applied, using ResourceManager cache."""
 
@@ -302,7 +520,7 @@ class Sprite:
             angle=self._snapped_rotation,
             flip_x=self._flip_x,
             flip_y=self._flip_y,
-            scale=self.scale
+            scale=self._vm.asset_scale(self.scale)
         )
 
 
@@ -4,15 +4,23 @@ import pygame
 from managers.input_manager import InputManager
 from managers.gamestate_manager import GameStateManager
 from managers.view_manager.view_manager import ViewManager
+from managers.graphic_manager import GraphicManager, BakeSpec
 from managers.debug_manager import DebugManager
 from managers.sound_manager import SoundManager
 from managers.settings_manager.settings_manager import SettingsManager
+from managers.physics_world import PhysicsWorld
+from managers.particle_manager.particle_manager import ParticleManager
 
 
 from gameobjects.game_object import GameObject
+from gameobjects.sprite import advance_all
+from gameobjects.projectile import ProjectilePool
 from stages.base_stage import BaseStage
 
 
+BATCH_PROJECTION_MIN = 16  # below this many objects projecting one by one is cheaper than building arrays
+
+
 class GameState(ABC): #ABC is Abstract Base Class
     """Base class for all game states."""
 
@@ -26,6 +34,8 @@ class GameState(ABC): #ABC is Abstract Base Class
         self.debug_manager: DebugManager = DebugManager()
         self.sound_manager: SoundManager = SoundManager()
         self.settings_manager: SettingsManager = SettingsManager()
+        self.graphic_manager: GraphicManager = GraphicManager()
+        self.physics_world: PhysicsWorld = PhysicsWorld()
 
   
         # references for easier access
@@ -35,13 +45,18 @@ class GameState(ABC): #ABC is Abstract Base Class
         # --- Game Objects ---
         self.player1: GameObject | None = None
         self.player2: GameObject | None = None
-        self.projectiles_p1 = []
-        self.projectiles_p2 = []
+        self.projectiles_p1 = ProjectilePool() # preallocated, see ProjectilePool.spawn()
+        self.projectiles_p2 = ProjectilePool()
         self.game_objects = []
+        self.particles = ParticleManager() # hit sparks, dust (screen space)
 
         # --- Stage ---
         self.stage: BaseStage | None = None
 
+        # --- Prebake ---
+        # transformed frames this state needs, baked in the background after enter()
+        self.prebake_specs: list[BakeSpec] = []
+
     @abstractmethod
     def enter(self):
         """Called when the state is entered."""
@@ -64,26 +79,37 @@ class GameState(ABC): #ABC is Abstract Base Class
             self.player1.update(dt)
         if self.player2:
             self.player2.update(dt)
-        for projectile in self.projectiles_p1:
-            projectile.update(dt)
-        for projectile in self.projectiles_p2:
-            projectile.update(dt)
+        self.projectiles_p1.update(dt)
+        self.projectiles_p2.update(dt)
         for game_object in self.game_objects:
             game_object.update(dt)
+        self.physics_world.step(dt) # all physics bodies in one vectorized step
+        self.particles.update(dt)
         if self.stage:
             self.stage.update(dt)
+        advance_all(self.animated_objects(), dt) # all animations, one pass per shared timeline
+
+    def animated_objects(self):
+        """Every object whose animation GameState.update() advances: players, projectiles, game objects and stage layers."""
+        if self.player1:
+            yield self.player1
+        if self.player2:
+            yield self.player2
+        yield from self.projectiles_p1.active
+        yield from self.projectiles_p2.active
+        yield from self.game_objects
+        if self.stage:
+            yield from self.stage.layers
 
     @abstractmethod
     def draw(self):
-        """Draw the state. """
+        """Draw the state. Sprites are submitted to the ViewManager render queue, their layer sets the draw order."""
         if self.stage:
             self.stage.draw()
-        for projectile in self.projectiles_p1:
-            projectile.draw()
-        for projectile in self.projectiles_p2:
-            projectile.draw()
-        for game_object in self.game_objects:
-            game_object.draw()
+        self.draw_objects(self.projectiles_p1.active)
+        self.draw_objects(self.projectiles_p2.active)
+        self.draw_objects(self.game_objects)
+        self.particles.draw()
         if self.player1:
             self.player1.draw()
         if self.player2:
@@ -107,13 +133,37 @@ class GameState(ABC): #ABC is Abstract Base Class
         
 
 
+    def draw_objects(self, objects: list[GameObject]):
+        """Draw `objects` in order; large lists are projected to the screen in one Camera.apply_many() call."""
+        if len(objects) < BATCH_PROJECTION_MIN:
+            for game_object in objects:
+                game_object.draw()
+            return
+        positions = [obj.get_render_pos() for obj in objects]
+        shake_factors = [obj.shake_factor for obj in objects]
+        screen_positions = self.camera.apply_many(positions, shake_factors).tolist()
+        for game_object, screen_pos in zip(objects, screen_positions):
+            game_object.draw(screen_pos if game_object.uses_camera else None)
+
+    def clear_objects(self):
+        """Drop all objects of the state (called by GameStateManager after exit())."""
+        self.player1 = None
+        self.player2 = None
+        self.projectiles_p1.clear()
+        self.projectiles_p2.clear()
+        self.game_objects = []
+        self.stage = None
+        self.physics_world.clear()
+        self.particles.clear()
+
     def add_game_object(self, game_object: GameObject):
         """Add a game object to the state."""
         self.game_objects.append(game_object)
 
     def remove_game_object(self, game_object: GameObject):
-        """Remove a game object from the state."""
+        """Remove a game object from the state (its physics body leaves the PhysicsWorld)."""
         self.game_objects.remove(game_object)
+        game_object.remove_physics()
 
     def to_scaled_pos(self, pos: pygame.Vector2, scale: int = 4):
         """transform unscaled to scaled position"""
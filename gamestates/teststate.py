@@ -9,7 +9,8 @@ from gameobjects.components.physics_components import FighterPhysicsComponent
 from gameobjects.components.player_controller_component import PlayerController
 import pygame
 
-from gameobjects.sprite import RenderAnchor
+from gameobjects.sprite import RenderAnchor, RenderLayer
+from managers.graphic_manager import BakeSpec
 from stages.stage1 import Stage1
 
 
@@ -18,6 +19,8 @@ from stages.stage1 import Stage1
 class TestState(GameState):
 
     def enter(self):
+        self.prebake_specs = [BakeSpec("gbFighter", scale=3, flip_x=True)]
+
         self.stage = Stage1()
         self.stage.configure_camera()
 
@@ -26,17 +29,24 @@ class TestState(GameState):
         cam.follow_enabled = False
 
         self.overlay = Sprite().set_anim_name("gbOverlay").set_scale(3).set_frame(1)
+        self.overlay.layer = RenderLayer.HUD
  
         self.player1 = BaseFighter(world_pos=(128, 228), player_index=0).set_anim_name("gbFighter").set_frame_tag("Idle").set_scale(3)
         self.player2 = BaseFighter(world_pos=(384, 228), player_index=1).set_anim_name("gbFighter").set_frame_tag("Idle").set_scale(3)
 
 
     def exit(self):
-        pass
+        self.overlay = None
 
     def handle_input(self):
         actions = self.input_manager.get_just_pressed_actions(0)
         actions_held = self.input_manager.get_pressed_actions(0)
+
+        # A fires a shot from the player's projectile pool
+        if Action.A in actions:
+            self.fire_shot(self.player1, self.projectiles_p1)
+        if Action.A in self.input_manager.get_just_pressed_actions(1):
+            self.fire_shot(self.player2, self.projectiles_p2)
         
         if Action.RIGHT in actions_held:
             pass
@@ -75,6 +85,13 @@ class TestState(GameState):
         self.view_manager.camera.update(dt, self.player1, self.player2)
         super().update(dt)
 
+    def fire_shot(self, player, pool):
+        """Spawn a shot in front of `player`, flying the way it faces (nothing if the pool is exhausted)."""
+        direction = 1 if player.facing_right else -1
+        x, y = player.world_pos
+        pool.spawn("gbFighter", (x + 24 * direction, y - 48), (300 * direction, 0), tag="Shot", scale=3,
+                   flip_x=not player.facing_right, lifetime=2.0)
+
 
     def draw(self):
         super().draw()
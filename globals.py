@@ -13,3 +13,7 @@ COLOR_LIGHT_GRAY = (192, 192, 192)
 
 
 
+
+# --- SIMULATION ---
+SIM_DT = 1 / 60            # fixed simulation step in seconds (60 Hz)
+MAX_TICKS_PER_FRAME = 5    # catch-up cap: after a longer hitch the game slows down instead of spiralling
@@ -1,11 +1,24 @@
+import os
+import time
 import pygame
+import globals
 from managers.service_provider import ServiceProvider
+from managers.asset_manifest import AssetManifest
+from managers.settings_manager.settings_manager import SettingsManager
 
 # --- Import all States ---
 from gamestates.teststate import TestState
 
 
 # --- Initialize ---
+# headless (settings "headless" or PYMUGEN_HEADLESS=1): SDL has to get its dummy drivers before pygame.init()
+settings = SettingsManager()
+settings.load()
+if settings.headless:
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+max_frames = int(os.environ.get("PYMUGEN_MAX_FRAMES", "0"))  # stop after this many frames (0 = run until quit)
+
 pygame.init()
 display_info = pygame.display.Info()
 clock = pygame.time.Clock() 
@@ -14,17 +27,20 @@ clock = pygame.time.Clock()
 sp = ServiceProvider() # create the service provider singleton to initialize all managers
 
 #sp.graphic_manager.convert_alpha = False  # for debugging, do not convert alpha
-
-# --- Load graphic resources ---
-sp.graphic_manager.load_spritesheet("gbFighter", "assets/Graphics/Aseprite/gbFighter.png", "assets/Graphics/Aseprite/gbFighter.json") # example spritesheet with tags
-sp.graphic_manager.load_spritesheet("nesFighter", "assets/Graphics/Aseprite/nesFighter.png", "assets/Graphics/Aseprite/nesFighter.json")
-sp.graphic_manager.load_spritesheet("debug32", "assets/Graphics/Aseprite/debug32.png", "assets/Graphics/Aseprite/debug32.json") # example spritesheet without tags
-sp.graphic_manager.load_png("debug32x32", "assets/Graphics/Aseprite/debug32x32.png") # example single PNG
-sp.graphic_manager.load_spritesheet("stage1-front", "assets/Graphics/Aseprite/stages/stage1-front.png", "assets/Graphics/Aseprite/stages/stage1-front.json")
-sp.graphic_manager.load_spritesheet("stage1-back", "assets/Graphics/Aseprite/stages/stage1-back.png", "assets/Graphics/Aseprite/stages/stage1-back.json")
-sp.graphic_manager.load_spritesheet("gbOverlay", "assets/Graphics/Aseprite/gbOverlay.png", "assets/Graphics/Aseprite/gbOverlay.json")
-sp.graphic_manager.load_spritesheet("highResNinja", "assets/Graphics/Aseprite/highResNinja.png", "assets/Graphics/Aseprite/highResNinja.json")
-
+#sp.graphic_manager.use_atlas = True  # pack the frames of every sheet into a few large atlas pages
+#sp.graphic_manager.trim_frames = True  # store only the opaque bounding box of each frame
+#sp.graphic_manager.dedup_frames = True  # identical frames share one surface
+#sp.graphic_manager.optimize_blits = True  # opaque / colorkey frames skip per-pixel blending
+#sp.view_manager.dirty_rects = True  # present only changed areas (low fill-rate machines)
+#sp.view_manager.set_render_scale(3)  # draw scale-1 assets into a 320x180 target, upscale once per frame
+
+# --- Assets ---
+# every asset is declared per game state in assets/manifest.json, GameStateManager loads the
+# group of a state when it is entered. Bundled animations (see bake_bundle.py) are memory-mapped
+# instead of decoded if the bundle is up to date.
+sp.graphic_manager.open_bundle("assets/bundle.pmb")
+sp.gamestate_manager.set_manifest(AssetManifest("assets/manifest.json", sp.graphic_manager, sp.sound_manager,
+                                                    render_scale=sp.view_manager.render_scale))
 
 
 # --- Set Offsets for spritesheets ---
@@ -34,11 +50,12 @@ sp.graphic_manager.load_spritesheet("highResNinja", "assets/Graphics/Aseprite/hi
 #sp.graphic_manager.set_tag_offset("nesFighter", "Idle", x=5, y=-3)
 #sp.graphic_manager.set_frame_offset("nesFighter", 1, x=6, y=-2)
 
-# --- Load soundeffect and music resources ---
-sp.sound_manager.load_music("choices", "assets/Music/choices.mp3")
-sp.sound_manager.load_music("darkchurch", "assets/Music/darkchurch.mp3")
-sp.sound_manager.load_sound("jump", "assets/Soundeffects/jump3.wav")
-
+# --- Headless runs ---
+if os.environ.get("PYMUGEN_INPUT_SCRIPT"):
+    sp.input_manager.load_script(os.environ["PYMUGEN_INPUT_SCRIPT"])  # see InputManager.load_script()
+if os.environ.get("PYMUGEN_CAPTURE_DIR"):
+    capture_dir = os.environ["PYMUGEN_CAPTURE_DIR"]
+    sp.view_manager.capture_hook = lambda surface, frame: pygame.image.save(surface, os.path.join(capture_dir, f"frame_{frame:05d}.png"))
 
 # --- Register Game States ---
 sp.gamestate_manager.add_state("test", TestState())
@@ -53,9 +70,17 @@ pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN]) # allow only these event
 
 
 # --- Main loop ---
+# The simulation runs in fixed globals.SIM_DT ticks (frame data stays deterministic), rendering
+# happens once per loop and interpolates between the last two ticks.
 running = True
+frame_count = 0
+accumulator = 0.0 # simulation time not yet consumed by ticks
+start_time = time.perf_counter()
 while running:
-    dt = clock.tick(60) / 1000.0 # dt in seconds as float (0.016 at 60fps)
+    if sp.view_manager.headless:
+        dt = globals.SIM_DT # not throttled, every frame advances exactly one tick (reproducible runs)
+    else:
+        dt = clock.tick(60) / 1000.0 # dt in seconds as float (0.016 at 60fps)
 
     # --- Global Event Handling for all States --- 
     for event in pygame.event.get():
@@ -67,20 +92,28 @@ while running:
             
                              
 
-    # --- Update CORE-Systems ---
     sp.debug_manager.update(dt)
-    sp.input_manager.update(dt)
-    sp.view_manager.update(dt) 
 
-    # --- Handle Input ---
-    sp.gamestate_manager.handle_input()
+    # --- Simulation ticks --- (catch up after slow frames, but at most MAX_TICKS_PER_FRAME)
+    accumulator = min(accumulator + dt, globals.MAX_TICKS_PER_FRAME * globals.SIM_DT)
+    while accumulator >= globals.SIM_DT:
+        # --- Update CORE-Systems ---
+        sp.input_manager.update(globals.SIM_DT)
+        sp.view_manager.update(globals.SIM_DT)
+
+        # --- Handle Input ---
+        sp.gamestate_manager.handle_input()
 
-    # --- Update current Game State ---
-    sp.gamestate_manager.update(dt)
+        # --- Update current Game State ---
+        sp.gamestate_manager.update(globals.SIM_DT)
+        accumulator -= globals.SIM_DT
 
-    # --- Draw ---
+    # --- Draw --- (in between the last two ticks)
+    # headless: exactly one tick per frame, the accumulator is always 0 -> show the tick itself
+    sp.view_manager.set_interpolation(1.0 if sp.view_manager.headless else accumulator / globals.SIM_DT)
     sp.view_manager.clear() # clear game surface
-    sp.gamestate_manager.draw() # draw to game surface
+    sp.gamestate_manager.draw() # submit sprites to the render queue
+    sp.view_manager.flush() # draw the render queue to game surface
 
     # --- Debug Draw ---    
     if sp.debug_manager.debug_on:
@@ -91,6 +124,12 @@ while running:
         
     sp.view_manager.draw_to_screen()
 
-    
+    frame_count += 1
+    if max_frames and frame_count >= max_frames:
+        running = False
+
+if sp.view_manager.headless:
+    elapsed = time.perf_counter() - start_time
+    print(f"Headless: {frame_count} frames in {elapsed:.2f} s ({elapsed * 1000 / max(frame_count, 1):.2f} ms/frame)")
 
 pygame.quit()
@@ -0,0 +1,261 @@
+import mmap
+import os
+import struct
+import pygame
+from typing import List
+from managers.blit_format import blit_format
+
+# Bundle layout (little endian):
+#   header   : magic, version, index offset, index size, bake flags
+#   pixels   : raw BGRA pixel buffers of all atlas pages, 16-byte aligned
+#   index    : per animation (name, scale): pages, frame rects + durations, tags, offsets, trim offsets, source paths
+#
+# BGRA byte order is the ARGB8888 layout convert_alpha() produces, so surfaces made with
+# pygame.image.frombuffer() blit like converted ones and nothing has to be decoded at startup.
+
+MAGIC = b"PMBUNDLE"
+VERSION = 5
+PIXEL_FORMAT = "BGRA"
+_HEADER = struct.Struct("<8sIQQI")
+_ALIGN = 16
+_KEY_SIZE = 16   # frame content key (see graphic_manager.frame_key), zeros if none
+
+# GraphicManager loader flags that change what is baked, a bundle baked with other flags is stale
+BAKE_ATLAS = 1
+BAKE_TRIM = 2
+BAKE_DEDUP = 4
+BAKE_OPTIMIZE_BLITS = 8
+
+
+def bake_flags(gm) -> int:
+    """Bake flags matching the loader flags of GraphicManager `gm`."""
+    return ((BAKE_ATLAS if gm.use_atlas else 0) | (BAKE_TRIM if gm.trim_frames else 0)
+            | (BAKE_DEDUP if gm.dedup_frames else 0) | (BAKE_OPTIMIZE_BLITS if gm.optimize_blits else 0))
+
+
+class BundleEntry:
+    """Index record of one animation at one scale."""
+
+    def __init__(self):
+        self.name = ""
+        self.scale = 1
+        self.png = False
+        self.sprite_size = (0, 0)
+        self.image_path = ""
+        self.json_path = ""
+        self.pages = []          # [(offset, w, h)]
+        self.frames = {}         # frame_idx -> (page, x, y, w, h)
+        self.durations = {}      # frame_idx -> ms
+        self.tags = {}           # tag name -> {"name", "from", "to", "direction"}
+        self.global_offset = (0, 0)
+        self.tag_offsets = {}    # tag name -> (x, y)
+        self.frame_offsets = {}  # frame_idx -> (x, y)
+        self.trim_offsets = {}   # frame_idx -> (x, y), trimmed frames only
+        self.frame_keys = {}     # frame_idx -> content key, dedup mode only
+        self.blit_formats = {}   # frame_idx -> (BlitFormat value the frame was stored in, colorkey)
+
+
+class AssetBundle:
+    """
+    Read-only view of a bundle file. The file is memory-mapped, page surfaces are built
+    with pygame.image.frombuffer() directly on the mapping (copy-on-write, never written back).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        magic, version, index_offset, index_size, self.flags = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            if magic != MAGIC:
+                raise ValueError(f"'{path}' is not an asset bundle.")
+            raise ValueError(f"Asset bundle '{path}' has version {version}, expected {VERSION}. Re-bake it.")
+
+        self.entries: List[BundleEntry] = _read_index(self._mmap[index_offset:index_offset + index_size])
+        self.index = {(e.name, e.scale): e for e in self.entries}   # (name, scale) -> entry
+
+    def build_pages(self, entry: BundleEntry) -> List[pygame.Surface]:
+        """Create the page surfaces of `entry` as zero-copy views into the mapping."""
+        view = memoryview(self._mmap)
+        return [
+            pygame.image.frombuffer(view[offset:offset + w * h * 4], (w, h), PIXEL_FORMAT)
+            for offset, w, h in entry.pages
+        ]
+
+    def close(self):
+        """Release the mapping and the file (surfaces built from it must not be used afterwards)."""
+        self._mmap.close()
+        self._file.close()
+
+    def is_stale(self, flags: int | None = None) -> bool:
+        """True if any source file changed after the bundle was baked, or it was baked with other `flags`."""
+        if flags is not None and flags != self.flags:
+            return True
+        baked = os.path.getmtime(self.path)
+        for entry in self.entries:
+            for source in (entry.image_path, entry.json_path):
+                if source and os.path.exists(source) and os.path.getmtime(source) > baked:
+                    return True
+        return False
+
+
+def write_bundle(path: str, animations: list, flags: int = 0):
+    """
+    Write `animations` (AnimationData loaded in atlas mode) into a bundle file at `path`.
+    `flags` are the bake_flags() of the GraphicManager that loaded them. Used by bake_bundle.py.
+    """
+    with open(path, "wb") as f:
+        f.write(b"\0" * _HEADER.size)
+
+        index = bytearray()
+        index += struct.pack("<I", len(animations))
+
+        for anim in animations:
+            if not anim.atlas_pages and not anim.png:
+                raise ValueError(f"Animation '{anim.base_name}' was not loaded in atlas mode.")
+
+            pages = list(anim.atlas_pages) if anim.atlas_pages else [anim.frames[0]]  # a PNG is its own page
+            for frame in anim.frames.values():
+                parent = frame.get_parent()
+                if parent is not None and parent not in pages:
+                    pages.append(parent)  # frame shared with another sheet (dedup mode), store its page here too
+            page_records = []
+            for page in pages:
+                _pad(f)
+                page_records.append((f.tell(), page.get_width(), page.get_height()))
+                f.write(pygame.image.tobytes(page, PIXEL_FORMAT))
+
+            _pack_str(index, anim.base_name)
+            index += struct.pack("<HBHH", anim.scale, anim.png, *anim.sprite_size)
+            _pack_str(index, anim._source_image_path or "")
+            _pack_str(index, anim._source_json_path or "")
+
+            index += struct.pack("<H", len(page_records))
+            for record in page_records:
+                index += struct.pack("<QHH", *record)
+
+            index += struct.pack("<I", len(anim.frames))
+            for idx, frame in anim.frames.items():
+                if frame in pages:
+                    page_idx, (x, y) = pages.index(frame), (0, 0)
+                else:
+                    page_idx, (x, y) = pages.index(frame.get_parent()), frame.get_offset()
+                index += struct.pack("<IHHHHHI", idx, page_idx, x, y, frame.get_width(), frame.get_height(),
+                                     anim.durations.get(idx, 100))
+                key = anim.frame_keys.get(idx)
+                index += key[0] if key else bytes(_KEY_SIZE)
+                colorkey = frame.get_colorkey() or (0, 0, 0)
+                index += struct.pack("<BBBB", blit_format(frame).value, *colorkey[:3])
+
+            index += struct.pack("<H", len(anim.tags))
+            for tag_name, tag in anim.tags.items():
+                _pack_str(index, tag_name)
+                index += struct.pack("<II", tag["from"], tag["to"])
+                _pack_str(index, tag.get("direction", "forward"))
+
+            index += struct.pack("<ii", *anim._global_offset)
+            index += struct.pack("<H", len(anim._tag_offsets))
+            for tag_name, (x, y) in anim._tag_offsets.items():
+                _pack_str(index, tag_name)
+                index += struct.pack("<ii", x, y)
+            index += struct.pack("<I", len(anim._frame_offsets))
+            for idx, (x, y) in anim._frame_offsets.items():
+                index += struct.pack("<Iii", idx, x, y)
+            index += struct.pack("<I", len(anim.trim_offsets))
+            for idx, (x, y) in anim.trim_offsets.items():
+                index += struct.pack("<Iii", idx, x, y)
+
+        _pad(f)
+        index_offset = f.tell()
+        f.write(index)
+
+        f.seek(0)
+        f.write(_HEADER.pack(MAGIC, VERSION, index_offset, len(index), flags))
+
+
+# ------------------------------------------------------------------
+# Private helpers
+# ------------------------------------------------------------------
+def _pad(f):
+    f.write(b"\0" * (-f.tell() % _ALIGN))
+
+
+def _pack_str(buf: bytearray, text: str):
+    data = text.encode("utf-8")
+    buf += struct.pack("<H", len(data))
+    buf += data
+
+
+class _Reader:
+    def __init__(self, data: bytes):
+        self.data = data
+        self.pos = 0
+
+    def unpack(self, fmt: str):
+        values = struct.unpack_from(fmt, self.data, self.pos)
+        self.pos += struct.calcsize(fmt)
+        return values
+
+    def raw(self, size: int) -> bytes:
+        data = self.data[self.pos:self.pos + size]
+        self.pos += size
+        return bytes(data)
+
+    def string(self) -> str:
+        (length,) = self.unpack("<H")
+        text = self.data[self.pos:self.pos + length].decode("utf-8")
+        self.pos += length
+        return text
+
+
+def _read_index(data: bytes) -> List[BundleEntry]:
+    r = _Reader(data)
+    entries = []
+    (count,) = r.unpack("<I")
+    for _ in range(count):
+        e = BundleEntry()
+        e.name = r.string()
+        e.scale, png, w, h = r.unpack("<HBHH")
+        e.png = bool(png)
+        e.sprite_size = (w, h)
+        e.image_path = r.string()
+        e.json_path = r.string()
+
+        (page_count,) = r.unpack("<H")
+        e.pages = [r.unpack("<QHH") for _ in range(page_count)]
+
+        (frame_count,) = r.unpack("<I")
+        for _ in range(frame_count):
+            idx, page, x, y, fw, fh, duration = r.unpack("<IHHHHHI")
+            e.frames[idx] = (page, x, y, fw, fh)
+            e.durations[idx] = duration
+            key = r.raw(_KEY_SIZE)
+            if any(key):
+                e.frame_keys[idx] = key
+            fmt, *colorkey = r.unpack("<BBBB")
+            e.blit_formats[idx] = (fmt, tuple(colorkey))
+
+        (tag_count,) = r.unpack("<H")
+        for _ in range(tag_count):
+            name = r.string()
+            start, end = r.unpack("<II")
+            e.tags[name] = {"name": name, "from": start, "to": end, "direction": r.string()}
+
+        e.global_offset = r.unpack("<ii")
+        (tag_offset_count,) = r.unpack("<H")
+        for _ in range(tag_offset_count):
+            name = r.string()
+            e.tag_offsets[name] = r.unpack("<ii")
+        (frame_offset_count,) = r.unpack("<I")
+        for _ in range(frame_offset_count):
+            idx, x, y = r.unpack("<Iii")
+            e.frame_offsets[idx] = (x, y)
+        (trim_offset_count,) = r.unpack("<I")
+        for _ in range(trim_offset_count):
+            idx, x, y = r.unpack("<Iii")
+            e.trim_offsets[idx] = (x, y)
+
+        entries.append(e)
+    return entries
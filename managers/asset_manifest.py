@@ -0,0 +1,101 @@
+import json
+from typing import List
+
+GLOBAL_GROUP = "global"  # always loaded, never unloaded
+
+
+class AssetManifest:
+    """
+    Declares all assets (spritesheets, PNGs, sounds, music) grouped by game state name.
+    GameStateManager.change_state() loads the groups of the incoming state and unloads
+    assets of other groups that no sprite uses anymore.
+
+    File format (assets/manifest.json):
+        {"groups": {"<group>": {
+            "spritesheets": {"<name>": {"image": ..., "json": ..., "scales": [3], "indexed": false}},
+            "pngs":         {"<name>": {"image": ..., "scales": [1]}},
+            "sounds":       {"<name>": "<path>"},
+            "music":        {"<name>": "<path>"}}}}
+    """
+
+    def __init__(self, path: str, graphic_manager, sound_manager, render_scale: int = 1):
+        self.path = path
+        self._gm = graphic_manager
+        self._sm = sound_manager
+        self.render_scale = render_scale  # ViewManager.render_scale: scales are divided by it (low-res rendering)
+
+        with open(path, "r") as f:
+            data = json.load(f)
+        self.groups = data.get("groups", {})
+
+    def get_group(self, name: str) -> dict:
+        """The asset declarations of group `name` (empty if the manifest has no such group)."""
+        return self.groups.get(name, {})
+
+    def load_groups(self, names: List[str]):
+        """Load every asset of the given groups that is not loaded yet."""
+        spritesheets, pngs, sounds, music = [], [], [], []
+
+        for group_name in names:
+            group = self.get_group(group_name)
+            for name, entry in group.get("spritesheets", {}).items():
+                if entry.get("indexed"):
+                    self._gm.indexed_sheets.add(name)
+                for scale in self._asset_scales(entry):
+                    if not self._is_loaded(name, scale) and (name, entry["image"], entry["json"], scale) not in spritesheets:
+                        spritesheets.append((name, entry["image"], entry["json"], scale))
+            for name, entry in group.get("pngs", {}).items():
+                for scale in self._asset_scales(entry):
+                    if not self._is_loaded(name, scale) and (name, entry["image"], scale) not in pngs:
+                        pngs.append((name, entry["image"], scale))
+            for name, path in group.get("sounds", {}).items():
+                if name not in self._sm.sounds:
+                    sounds.append((name, path))
+            for name, path in group.get("music", {}).items():
+                if name not in self._sm.music_tracks:
+                    music.append((name, path))
+
+        # one sheet at several scales: load the first one, derive the rest (and re-create evicted ones)
+        first_scale = {}
+        for entry in spritesheets:
+            if entry[0] not in self._gm.animations:
+                first_scale.setdefault(entry[0], entry)
+        self._gm.load_many(spritesheets=list(first_scale.values()), pngs=pngs)
+        for name, image_path, json_path, scale in spritesheets:
+            self._gm.get_or_create_scaled(name, scale)
+
+        self._sm.load_many(sounds=sounds, music=music)
+
+    def unload_unused(self, keep_groups: List[str]):
+        """
+        Unload assets declared in other groups than `keep_groups` (and the global group).
+        Animations are only released when no sprite references any of their scales.
+        """
+        keep = {GLOBAL_GROUP, *keep_groups}
+        needed = {kind: set() for kind in ("graphics", "sounds", "music")}
+        candidates = {kind: set() for kind in needed}
+
+        for group_name, group in self.groups.items():
+            target = needed if group_name in keep else candidates
+            target["graphics"].update(group.get("spritesheets", {}))
+            target["graphics"].update(group.get("pngs", {}))
+            target["sounds"].update(group.get("sounds", {}))
+            target["music"].update(group.get("music", {}))
+
+        for name in candidates["graphics"] - needed["graphics"]:
+            if name in self._gm.animations and not self._gm.has_users(name):
+                self._gm.unload(name)
+
+        for name in candidates["sounds"] - needed["sounds"]:
+            self._sm.unload_sound(name)
+        for name in candidates["music"] - needed["music"]:
+            self._sm.unload_music(name)
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+    def _asset_scales(self, entry: dict) -> list:
+        return sorted({max(1, scale // self.render_scale) for scale in entry.get("scales", [1])})
+
+    def _is_loaded(self, name: str, scale: int) -> bool:
+        return name in self._gm.animations and scale in self._gm.animations[name]
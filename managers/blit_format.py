@@ -0,0 +1,61 @@
+import numpy as np
+import pygame
+from enum import Enum, auto
+
+
+class BlitFormat(Enum):
+    OPAQUE = auto()     # no transparency: plain copy blit
+    COLORKEY = auto()   # only fully transparent/opaque pixels: colorkey (RLE for standalone frames)
+    ALPHA = auto()      # semi-transparent pixels: per-pixel alpha blending
+
+
+def classify_frame(frame: pygame.Surface) -> BlitFormat:
+    """Cheapest blit format that draws `frame` unchanged."""
+    alpha = pygame.image.tobytes(frame, "RGBA")[3::4]
+    opaque = alpha.count(255)
+    if opaque == len(alpha):
+        return BlitFormat.OPAQUE
+    if opaque + alpha.count(0) == len(alpha):
+        return BlitFormat.COLORKEY
+    return BlitFormat.ALPHA
+
+
+def blit_format(surface: pygame.Surface) -> BlitFormat:
+    """The blit format `surface` is currently stored in."""
+    if surface.get_colorkey() is not None:
+        return BlitFormat.COLORKEY
+    if surface.get_flags() & pygame.SRCALPHA and surface.get_alpha() is not None:
+        return BlitFormat.ALPHA
+    return BlitFormat.OPAQUE
+
+
+def optimize_frame(frame: pygame.Surface) -> pygame.Surface:
+    """Return `frame` stored in its cheapest blit format (standalone surfaces only)."""
+    fmt = classify_frame(frame)
+    if fmt == BlitFormat.OPAQUE:
+        return frame.convert()
+    if fmt == BlitFormat.COLORKEY:
+        key = unused_color(frame)
+        keyed = pygame.Surface(frame.get_size()).convert()
+        keyed.fill(key)
+        keyed.blit(frame, (0, 0))
+        keyed.set_colorkey(key, pygame.RLEACCEL)
+        return keyed
+    return frame
+
+
+def unused_color(surface: pygame.Surface) -> tuple:
+    """A color no pixel of `surface` uses (magenta if possible), to be used as colorkey."""
+    rgb = np.frombuffer(pygame.image.tobytes(surface, "RGB"), dtype=np.uint8).reshape(-1, 3).astype(np.uint32)
+    used = np.unique(rgb[:, 0] << 16 | rgb[:, 1] << 8 | rgb[:, 2])  # sorted 0xRRGGBB codes
+    for color in ((255, 0, 255), (0, 255, 255), (255, 255, 0)):
+        code = color[0] << 16 | color[1] << 8 | color[2]
+        index = np.searchsorted(used, code)
+        if index == len(used) or used[index] != code:
+            return color
+    # smallest code missing from the sorted codes: the first position where used[i] != i
+    gaps = np.flatnonzero(used != np.arange(len(used), dtype=np.uint32))
+    code = int(gaps[0]) if len(gaps) else len(used)
+    if code > 0xFFFFFF:
+        raise ValueError("surface uses every RGB color, no colorkey available")
+    return code >> 16, (code >> 8) & 0xFF, code & 0xFF
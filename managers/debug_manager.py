@@ -21,6 +21,9 @@ class DebugManager:
         self._cpu_percent = 0
         self._mem_used_mb = 0
         self._process = psutil.Process()
+        self._surface_stats = None  # GraphicManager.get_surface_stats(), refreshed with the system info
+        self._memory_usage = {}     # GraphicManager.get_memory_usage(), refreshed with the system info
+        self.memory_panel_lines = 8  # largest (name, scale) entries listed in the GFX memory panel
 
         self._rect_cache = {}  # key: (w, h, color, alpha)
 
@@ -46,6 +49,7 @@ class DebugManager:
         self._game_window_height = 0
         self._debug_overlay = None
         self._camera = None
+        self._graphic_manager = None
 
     def bind_service_provider(self, sp):
         self._sp = sp
@@ -59,6 +63,7 @@ class DebugManager:
         )
         self._camera = self._view_manager.camera
         self._gamestate_manager = self._sp.gamestate_manager
+        self._graphic_manager = self._sp.graphic_manager
 
         
 
@@ -102,6 +107,23 @@ class DebugManager:
         self.line(f"cam_x_travel: {self._camera.x_travel}")
         self.line(f"cam_y_travel_min: {self._camera.y_travel_min}")
         self.line(f"cam_y_travel_max: {self._camera.y_travel_max}")
+
+        if self._surface_stats:
+            st = self._surface_stats
+            self.line(f"GFX surfaces: {st['standalone_count']} -> {st['resident_count']}")
+            self.line(f"GFX memory: {st['standalone_bytes'] / (1024 * 1024):.1f} -> {st['resident_bytes'] / (1024 * 1024):.1f} MB")
+
+        cull = self._view_manager.cull_stats
+        self.line(f"Objects drawn/culled: {cull['drawn']}/{cull['culled']}")
+
+        if self._graphic_manager is not None:
+            rc = self._graphic_manager.get_rotation_cache_stats()
+            self.line(f"ROT cache: {rc['entries']} / {rc['bytes'] / (1024 * 1024):.1f} MB")
+            self.line(f"ROT hit/miss/evict: {rc['hits']}/{rc['misses']}/{rc['evictions']}")
+            gm = self._graphic_manager
+            if gm.prebake_total:
+                self.line(f"Prebake: {gm.prebake_done}/{gm.prebake_total}")
+            self._draw_memory_panel()
     
         
 
@@ -178,6 +200,23 @@ class DebugManager:
                     self._debug_cursor_x += self._debug_column_width
                     self._debug_cursor_y = self._lower_section_min_y
 
+    def _draw_memory_panel(self):
+        """Resident bytes per (name, scale), largest first, against the GraphicManager budget."""
+        gm = self._graphic_manager
+        used = sum(self._memory_usage.values())
+        if gm.memory_budget is None:
+            self.line(f"GFX resident: {used / (1024 * 1024):.1f} MB (no budget)")
+        else:
+            over = used > gm.memory_budget
+            self.line(f"GFX budget: {used / (1024 * 1024):.1f} / {gm.memory_budget / (1024 * 1024):.1f} MB",
+                      color=(255, 80, 80) if over else (255, 255, 0))
+
+        largest = sorted(self._memory_usage.items(), key=lambda item: -item[1])[:self.memory_panel_lines]
+        for (name, scale), nbytes in largest:
+            anim = gm.animations.get(name, {}).get(scale)
+            users = len(anim.users) if anim is not None else 0
+            self.line(f"  {name} x{scale}: {nbytes / (1024 * 1024):.1f} MB ({users} users)")
+
     def _draw_fps_systeminfo(self, x, y):
         if not self.debug_on or self._view_manager is None:
             return
@@ -189,6 +228,9 @@ class DebugManager:
         self._cpu_percent = self._process.cpu_percent()
         mem_info = self._process.memory_info()
         self._mem_used_mb = mem_info.rss / (1024 * 1024)
+        if self._graphic_manager is not None:
+            self._surface_stats = self._graphic_manager.get_surface_stats()
+            self._memory_usage = self._graphic_manager.get_memory_usage()
 
     def _get_rect_surface(self, width, height, color, alpha):
         key = (width, height, color, alpha)
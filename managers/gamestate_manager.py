@@ -1,22 +1,54 @@
+from dataclasses import replace
 from decorators import singleton
+from managers.asset_manifest import GLOBAL_GROUP
 
 @singleton
 class GameStateManager:
     def __init__(self):
         self.states = {}         # map name → GameState
         self.current_state = None
+        self._sp = None  # set by ServiceProvider after all managers are initialized
+        self.manifest = None  # AssetManifest, loads/unloads asset groups per state
+
+    def bind_service_provider(self, sp):
+        self._sp = sp
+
+    def set_manifest(self, manifest):
+        """Use `manifest` to load the asset group of each state on change_state()."""
+        self.manifest = manifest
 
     def add_state(self, name: str, state):
         self.states[name] = state
 
     def change_state(self, name: str):
+        if name not in self.states:
+            raise ValueError(f"State '{name}' does not exist!")
+
         if self.current_state:
             self.current_state.exit()
-        self.current_state = self.states.get(name)
-        if self.current_state:
-            self.current_state.enter()
-        else:
-            raise ValueError(f"State '{name}' does not exist!")
+            self.current_state.clear_objects()  # drop sprite references so their assets can be unloaded
+
+        # cached transforms of the old state should not survive into an unrelated state
+        if self._sp:
+            self._sp.graphic_manager.clear_rotation_cache()
+            self._sp.view_manager.invalidate()
+
+        if self.manifest:
+            self.manifest.load_groups([GLOBAL_GROUP, name])
+
+        self.current_state = self.states[name]
+        self.current_state.enter()
+        # fill the rotation cache for the new state in the background
+        if self._sp and self.current_state.prebake_specs:
+            vm = self._sp.view_manager
+            specs = [replace(spec, scale=vm.asset_scale(spec.scale)) for spec in self.current_state.prebake_specs]
+            self._sp.graphic_manager.prebake(specs)
+
+        # release assets of other states that nothing references anymore
+        if self.manifest:
+            self.manifest.unload_unused([name])
+        if self._sp:
+            self._sp.graphic_manager.enforce_memory_budget()
 
     def handle_input(self):
         if self.current_state:
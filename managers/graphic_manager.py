@@ -1,8 +1,212 @@
+import hashlib
 import json
+import os
+import sys
+import threading
+import weakref
+import numpy as np
 import pygame
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Dict, List
 from decorators import singleton
-
+from managers.texture_atlas import TextureAtlas
+from managers.surface_cache import SurfaceCache
+from managers.asset_bundle import AssetBundle, bake_flags
+from managers.blit_format import BlitFormat, blit_format, classify_frame, optimize_frame, unused_color
+
+
+def surface_bytes(surface: pygame.Surface) -> int:
+    """Pixel memory of a surface in bytes."""
+    return surface.get_bytesize() * surface.get_width() * surface.get_height()
+
+
+def cut_frame(spritesheet: pygame.Surface, rect: pygame.Rect, scale: int) -> pygame.Surface:
+    """Cut one standalone frame out of a spritesheet at `scale`."""
+    frame = spritesheet.subsurface(rect)
+    if scale == 1:
+        return frame.copy()
+    return pygame.transform.scale(frame, (int(rect.width * scale), int(rect.height * scale)))
+
+
+def frame_key(spritesheet: pygame.Surface, rect: pygame.Rect) -> bytes:
+    """Content hash of the frame `rect` on `spritesheet` (indexed sheets: palette indices + palette)."""
+    frame = spritesheet.subsurface(rect)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{rect.width}x{rect.height}".encode())
+    if frame.get_bitsize() == 8:
+        digest.update(pygame.image.tobytes(frame, "P"))
+        digest.update(bytes(c for color in frame.get_palette() for c in color))
+    else:
+        digest.update(pygame.image.tobytes(frame, "RGBA"))
+    return digest.digest()
+
+
+def trim_rect(spritesheet: pygame.Surface, rect: pygame.Rect) -> tuple:
+    """
+    Opaque bounding box of the frame `rect` on `spritesheet`. Returns (sheet rect, (x, y) within the frame).
+    The box keeps the parity of the frame size, so centering it and mirroring its offset stays pixel exact.
+    """
+    frame = spritesheet.subsurface(rect)
+    if frame.get_bitsize() == 8:
+        # get_bounding_rect() compares colors, an opaque palette entry may share the colorkey's color:
+        # bound everything but index 0 on a copy where only index 0 is black
+        frame = frame.copy()
+        frame.set_palette([(0, 0, 0)] + [(255, 255, 255)] * 255)
+        frame.set_colorkey(0)
+    bound = frame.get_bounding_rect()
+    if bound.width == 0 or bound.height == 0:
+        bound = pygame.Rect(rect.width // 2, rect.height // 2, 1, 1)  # empty frame
+
+    if (rect.width - bound.width) % 2:
+        if bound.right < rect.width:
+            bound.width += 1
+        else:
+            bound.x -= 1
+            bound.width += 1
+    if (rect.height - bound.height) % 2:
+        if bound.bottom < rect.height:
+            bound.height += 1
+        else:
+            bound.y -= 1
+            bound.height += 1
+
+    return bound.move(rect.topleft), bound.topleft
+
+
+def to_indexed(image: pygame.Surface, name: str = "") -> tuple:
+    """
+    Convert an RGBA image into an 8-bit palette surface. Returns (surface, palette).
+    Index 0 is the transparent colorkey, the other colors get an index in order of first
+    appearance, so the same image always yields the same palette.
+    """
+    pixels = memoryview(pygame.image.tobytes(image, "RGBA")).cast("I")
+
+    lookup = {}
+    palette = [(0, 0, 0)]  # index 0: transparent
+    for pixel in dict.fromkeys(pixels):
+        r, g, b, a = pixel.to_bytes(4, sys.byteorder)
+        if a == 0:
+            lookup[pixel] = 0
+            continue
+        if a < 255:
+            raise ValueError(f"'{name}' has semi-transparent pixels, an indexed sheet can only be opaque or transparent.")
+        lookup[pixel] = len(palette)
+        palette.append((r, g, b))
+
+    if len(palette) > 256:
+        raise ValueError(f"'{name}' has {len(palette) - 1} colors, an indexed sheet allows at most 255.")
+
+    surface = pygame.image.frombytes(bytes(map(lookup.__getitem__, pixels)), image.get_size(), "P")
+    surface.set_palette(palette)
+    surface.set_colorkey(0)
+    return surface, palette
+
+
+class LazyFrames(dict):
+    """
+    Frame dict (int -> Surface) that cuts frames out of the spritesheet on first access,
+    always a whole tag at a time (untagged frames one by one).
+    Reading it like a dict (len, `in`, iteration, get, keys, values, items) covers all frames
+    of the sheet, values()/items() cut whatever is missing. resident_frames() is what is cut so far.
+    """
+
+    def __init__(self, spritesheet: pygame.Surface, rects: Dict[int, pygame.Rect], scale: int, tags: Dict[str, dict],
+                 aliases: Dict[int, int] | None = None, prepare=None):
+        super().__init__()
+        self.spritesheet = spritesheet   # kept resident, frames are cut from it on demand
+        self._rects = rects
+        self._scale = scale
+        self._aliases = aliases or {}    # frame_idx -> first frame_idx with identical pixels
+        self._prepare = prepare          # optional Surface -> Surface applied to every cut frame
+
+        # frame_idx -> (from, to) of the first tag the frame belongs to
+        self._tag_ranges = {}
+        for info in tags.values():
+            for idx in range(info["from"], info["to"] + 1):
+                self._tag_ranges.setdefault(idx, (info["from"], info["to"]))
+
+    def __missing__(self, idx):
+        if idx not in self._rects:
+            raise KeyError(idx)
+        start, end = self._tag_ranges.get(idx, (idx, idx))
+        self.materialize(range(start, end + 1))
+        return dict.__getitem__(self, idx)
+
+    def __len__(self):
+        return len(self._rects)
+
+    def __contains__(self, idx):
+        return idx in self._rects
+
+    def __iter__(self):
+        return iter(self._rects)
+
+    def get(self, idx, default=None):
+        return self[idx] if idx in self._rects else default
+
+    def keys(self):
+        return self._rects.keys()
+
+    def values(self):
+        return [self[idx] for idx in self._rects]
+
+    def items(self):
+        return [(idx, self[idx]) for idx in self._rects]
+
+    def resident_frames(self):
+        """Frames cut so far, without cutting the rest."""
+        return dict.values(self)
+
+    def materialize(self, indices):
+        for idx in indices:
+            if idx in self._rects and not dict.__contains__(self, idx):
+                first = self._aliases.get(idx, idx)
+                if not dict.__contains__(self, first):
+                    frame = cut_frame(self.spritesheet, self._rects[first], self._scale)
+                    dict.__setitem__(self, first, self._prepare(frame) if self._prepare else frame)
+                dict.__setitem__(self, idx, dict.__getitem__(self, first))
+
+    def resident_count(self) -> int:
+        return len({id(frame) for frame in dict.values(self)})
+
+    def full_bytes(self) -> int:
+        """Pixel bytes of all frames once every frame is materialized."""
+        bytesize = self.spritesheet.get_bytesize()
+        return sum(int(r.width * self._scale) * int(r.height * self._scale) * bytesize for r in self._rects.values())
+
+
+@dataclass
+class BakeSpec:
+    """Declares which transformed frames of one animation to pre-bake into the rotation cache."""
+    anim_name: str
+    scale: int = 1
+    flip_x: bool = False             # bake the horizontally flipped frames
+    flip_y: bool = False             # bake the vertically flipped frames
+    angle_step: int = 0              # bake every rotation in steps of this many degrees (0 = no rotation)
+    tags: List[str] | None = None    # only bake frames of these tags (None = all frames)
+
+
+@dataclass
+class Timeline:
+    """Compiled playback order of one tag (or of all frames): frames[i] is shown until ends[i] ms into the loop."""
+    frames: List[int]      # frame indices in playback order
+    durations: List[int]   # duration of every frame in ms
+    ends: List[float]      # cumulative end time of every frame in ms
+    offsets: List[tuple]   # final offset of every frame
+    length: float          # loop length in ms (ends[-1])
+
+    def start(self, pos: int) -> float:
+        """Time in ms at which frames[pos] starts."""
+        return self.ends[pos - 1] if pos else 0.0
+
+    @cached_property
+    def arrays(self) -> tuple:
+        """(durations, starts, ends) as float64 arrays, for advancing many sprites at once (sprite.advance_all)."""
+        ends = np.array(self.ends, dtype=np.float64)
+        starts = np.concatenate(([0.0], ends[:-1]))
+        return np.array(self.durations, dtype=np.float64), starts, ends
 
 
 class AnimationData:
@@ -22,6 +226,14 @@ class AnimationData:
         self._frame_offsets = {}       # frame_idx → (x, y)
         self.final_offsets = {}       # frame_idx → (x, y)      this is passed as reference to sprite objects
 
+        self.atlas_pages = []          # page surfaces owning the pixels of `frames` (atlas mode only)
+        self.palette = None            # list of (r, g, b) if the frames are 8-bit indexed surfaces
+        self.trim_offsets = {}         # frame_idx -> (x, y) center shift of a trimmed frame, included in final_offsets
+        self.frame_keys = {}           # frame_idx -> content identity of the frame, shared by identical frames
+        self.users = weakref.WeakSet()  # sprites currently using this animation
+        self._timelines = {}           # tag name (None = all frames) -> Timeline, see get_timeline()
+        self.placements = {}           # (frame_idx, anchor, flip_x, flip_y) -> draw placement, filled by Sprite.get_blit()
+
         # Private attributes
         self._source_image_path = None  # is set by GraphicManager when loading
         self._source_json_path = None   # is set by GraphicManager when loading
@@ -45,12 +257,56 @@ class AnimationData:
         self._frame_offsets[frame_idx] = (x, y)
         self._rebuild_offsets()
 
+    def get_timeline(self, tag_name: str | None = None) -> Timeline:
+        """
+        Timeline of tag `tag_name` (None = all frames in order), compiled on first use.
+        Sprites look up their frame with a bisect over Timeline.ends instead of stepping frame by frame.
+        """
+        timeline = self._timelines.get(tag_name)
+        if timeline is None:
+            if tag_name is None:
+                frames = list(range(len(self.frames)))
+            else:
+                info = self.tags[tag_name]
+                frames = list(range(info["from"], info["to"] + 1))
+            durations = [self.durations.get(idx, 100) for idx in frames]  # default to 100ms if not specified
+            ends, total = [], 0.0
+            for duration in durations:
+                total += duration
+                ends.append(total)
+            offsets = [self.final_offsets.get(idx, (0, 0)) for idx in frames]
+            timeline = self._timelines[tag_name] = Timeline(frames, durations, ends, offsets, total)
+        return timeline
+
+    @property
+    def blit_formats(self) -> Dict[int, BlitFormat]:
+        """Blit format each materialized frame is stored in (never cuts a lazy frame)."""
+        return {idx: blit_format(frame) for idx, frame in dict.items(self.frames)}
+
+    # ------------------------------------------------------------------
+    # LAZY FRAMES
+    # ------------------------------------------------------------------
+    def prefetch(self, tags: List[str] | None = None):
+        """Cut the frames of `tags` (None = all frames) now instead of on first use. No-op unless lazy."""
+        if not isinstance(self.frames, LazyFrames):
+            return
+        if tags is None:
+            self.frames.materialize(self.frames)
+            return
+        for tag_name in tags:
+            if tag_name not in self.tags:
+                raise ValueError(f"Tag '{tag_name}' does not exist in animation.")
+            info = self.tags[tag_name]
+            self.frames.materialize(range(info["from"], info["to"] + 1))
+
     # ------------------------------------------------------------------
     # INTERNAL: Build final offset lookup table
     # ------------------------------------------------------------------
     def _rebuild_offsets(self):
         
-        self.final_offsets = {}
+        self.final_offsets.clear()  # in place, sprites hold a reference
+        self._timelines = {}  # compiled with the old offsets
+        self.placements = {}
         frame_to_tag: dict[int, str] = {}
 
         # Map frames to first tag, warn on overlap
@@ -84,6 +340,11 @@ class AnimationData:
             fx += frame_offset[0]
             fy += frame_offset[1]
 
+            # Trim
+            trim_offset = self.trim_offsets.get(idx, (0, 0))
+            fx += trim_offset[0]
+            fy += trim_offset[1]
+
             self.final_offsets[idx] = (fx, fy)
 
 
@@ -91,35 +352,90 @@ class AnimationData:
 class GraphicManager:
     def __init__(self):
         self.animations = {}        # name -> AnimationData
-        self._rotation_cache = {}   # shared cache across all objects
+        self._rotation_cache = SurfaceCache(max_bytes=64 * 1024 * 1024)   # shared LRU cache across all objects
+        self._cache_lock = threading.Lock()   # the prebake worker fills the cache from another thread
+
+        # Prebake state (see prebake())
+        self._bake_generation = 0   # bumped to cancel a running bake
+        self._bake_thread = None
+        self.prebake_done = 0
+        self.prebake_total = 0
 
         self.convert_alpha = True  # whether to convert images with alpha
 
-    def load_spritesheet(self, name: str, image_path: str, json_path: str, scale: int = 1):
+        # Atlas mode: repack all frames of a sheet (per scale) into a few large pages
+        self.use_atlas = False
+        self.atlas_page_size = 2048
+
+        # Lazy mode: frames are only cut (and scaled) when a tag is first used, takes precedence over atlas mode
+        self.lazy_frames = False
+
+        self._bundles = []          # open AssetBundles, their mappings back the surfaces of bundled animations
+
+        # Residency budget: bytes all resident animations may use before unused scales are evicted (None = unlimited)
+        self.memory_budget = None
+        self._sources = {}          # name -> source paths + scale-1 offsets, to re-create any evicted scale
+        self._evicted = set()       # (name, scale) evicted by the budget, re-created on next use
+
+        # Trim mode: only the opaque bounding box of each frame is stored, the shift is folded into the offsets
+        self.trim_frames = False
+
+        # Dedup mode: identical frames (within and across sheets) share one surface and one set of cached transforms
+        self.dedup_frames = False
+        self._shared_frames = weakref.WeakValueDictionary()   # (content key, scale) -> Surface
+
+        # Blit format mode: every frame is stored opaque, colorkey (RLE) or per-pixel alpha, whatever is cheapest
+        self.optimize_blits = False
+
+        # Indexed sheets: kept as 8-bit palette surfaces, sprites can swap colors with set_palette()
+        self.indexed_sheets = set()  # names of spritesheets to load indexed
+        self.palettes = {}          # palette name -> list of (r, g, b), see make_palette()
+
+    def load_spritesheet(self, name: str, image_path: str, json_path: str, scale: int = 1, indexed: bool = False):
         if name in self.animations and scale in self.animations[name]:
             raise ValueError(f"Animation '{name}' with scale {scale} already loaded.")
+        if indexed:
+            self.indexed_sheets.add(name)
+
+        img, data = self._read_spritesheet(image_path, json_path)
+        self._build_spritesheet(name, img, data, image_path, json_path, scale)
 
+    def _read_spritesheet(self, image_path: str, json_path: str):
+        """Decode the PNG and parse the JSON. No display access, safe to run on a worker thread."""
         with open(json_path, "r") as f:
             data = json.load(f)
+        return pygame.image.load(image_path), data
+
+    def _build_spritesheet(self, name: str, img: pygame.Surface, data: dict, image_path: str, json_path: str, scale: int):
+        """Convert the decoded sheet and create the AnimationData (main thread only)."""
+        palette = None
+        if name in self.indexed_sheets and classify_frame(img) == BlitFormat.ALPHA:
+            # a palette has no alpha, soft edges would be drawn opaque: keep this sheet 32-bit
+            print(f"⚠️ '{name}' has semi-transparent pixels, loaded as an RGBA sheet instead of indexed.")
+            self.indexed_sheets.discard(name)
+        if name in self.indexed_sheets:
+            spritesheet, palette = to_indexed(img, name)  # 1 byte per pixel, colors live in the palette
+        else:
+            spritesheet = img.convert_alpha() if self.convert_alpha else img.convert()
 
-        img = pygame.image.load(image_path)
-        spritesheet = img.convert_alpha() if self.convert_alpha else img.convert()
-
-        frames = {}
+        rects = {}
         durations = {}
+        source_sizes = {}   # untrimmed frame size
+        trims = {}          # frame_idx -> (x, y) of the stored rect within the untrimmed frame
 
         for k, v in data["frames"].items():
             idx = int(k)
-            rect = pygame.Rect(v["frame"]["x"], v["frame"]["y"], v["frame"]["w"], v["frame"]["h"])
-            frame = spritesheet.subsurface(rect).copy()
-            if scale != 1:
-                new_size = (int(rect.width * scale), int(rect.height * scale))
-                frame = pygame.transform.scale(frame, new_size)
-            frames[idx] = frame
+            rects[idx] = pygame.Rect(v["frame"]["x"], v["frame"]["y"], v["frame"]["w"], v["frame"]["h"])
             durations[idx] = v.get("duration", 100)
-        
-        # Get sprite size from first frame
-        sprite_size = frames[0].get_size() if frames else (0, 0)
+            source_sizes[idx] = (v["sourceSize"]["w"], v["sourceSize"]["h"]) if "sourceSize" in v else rects[idx].size
+
+            if v.get("trimmed"):
+                # already trimmed by Aseprite
+                trims[idx] = (v["spriteSourceSize"]["x"], v["spriteSourceSize"]["y"])
+            elif self.trim_frames:
+                rects[idx], trims[idx] = trim_rect(spritesheet, rects[idx])
+
+        keys = {idx: frame_key(spritesheet, rect) for idx, rect in rects.items()} if self.dedup_frames else {}
 
         tags_list = data.get("meta", {}).get("frameTags", [])
         seen = set()
@@ -135,66 +451,128 @@ class GraphicManager:
         if name not in self.animations:
             self.animations[name] = {}
 
-        # create base (scale 1) if missing
-        if 1 not in self.animations[name]:
-            base_frames = {}
-            for k, v in data["frames"].items():
-                idx = int(k)
-                rect = pygame.Rect(v["frame"]["x"], v["frame"]["y"], v["frame"]["w"], v["frame"]["h"])
-                base_frames[idx] = spritesheet.subsurface(rect).copy()
-
-            base_anim = AnimationData(base_frames, durations, tags,
-                                    base_frames[0].get_size() if base_frames else (0, 0),
-                                    name, png=False, scale=1)
-            
-            base_anim._source_image_path = image_path  # store source path for reference
-            base_anim._source_json_path = json_path    # store source path for reference
-
-            self.animations[name][1] = base_anim
-
-        # create requested scale if missing
-        if scale not in self.animations[name]:
-            if scale == 1:
-                return
-
-            scaled_frames = {}
-            for idx, frame in self.animations[name][1].frames.items():
-                new_size = (int(frame.get_width() * scale), int(frame.get_height() * scale))
-                scaled_frames[idx] = pygame.transform.scale(frame, new_size)
-
-            scaled_anim = AnimationData(
-                scaled_frames,
-                durations,
-                tags,
-                scaled_frames[0].get_size() if scaled_frames else (0, 0),
-                name,
-                png=False,
-                scale=scale
-            )
-
-            scaled_anim._source_image_path = self.animations[name][1]._source_image_path  # reference original source
-            scaled_anim._source_json_path = self.animations[name][1]._source_json_path    # reference original source
-
-            self.animations[name][scale] = scaled_anim
+        # first load also creates the base (scale 1), later loads only re-create the requested scale
+        scales = (scale,) if name in self._sources else (1, scale)
+        self._remember_source(name, False, image_path, json_path)
+        for s in scales:
+            if s in self.animations[name]:
+                continue
+
+            frames, atlas_pages = self._slice_frames(spritesheet, rects, s, tags, keys)
+            if palette and atlas_pages:
+                # frames cut from the sheet inherit palette and colorkey, atlas pages start without
+                for surface in atlas_pages + list(frames.values()):
+                    surface.set_palette(palette)
+                    surface.set_colorkey(0)
+
+            sprite_size = (int(source_sizes[0][0] * s), int(source_sizes[0][1] * s)) if 0 in rects else (0, 0)
+            anim = AnimationData(frames, durations, tags, sprite_size, name, png=False, scale=s)
+            anim.atlas_pages = atlas_pages
+            anim.palette = palette
+            anim.frame_keys = {idx: (key, s) for idx, key in keys.items()}
+            if trims:
+                # shift from the untrimmed frame center to the stored rect center, at this scale
+                anim.trim_offsets = {
+                    idx: (tx * s + rects[idx].width * s // 2 - source_sizes[idx][0] * s // 2,
+                          ty * s + rects[idx].height * s // 2 - source_sizes[idx][1] * s // 2)
+                    for idx, (tx, ty) in trims.items()
+                }
+                anim.final_offsets = dict(anim.trim_offsets)
+
+            anim._source_image_path = image_path  # store source path for reference
+            anim._source_json_path = json_path    # store source path for reference
+
+            self.animations[name][s] = anim
+
+    def _slice_frames(self, spritesheet: pygame.Surface, rects: Dict[int, pygame.Rect], scale: int, tags: Dict[str, dict],
+                      keys: Dict[int, bytes]):
+        """
+        Cut all frames out of `spritesheet` at `scale`.
+        Returns (frames, atlas_pages). In atlas mode the frames are subsurface views into
+        the returned pages, otherwise every frame is a standalone surface and the page list is empty.
+        In lazy mode nothing is cut yet, frames are cut per tag on first access (see LazyFrames).
+        With content `keys` (dedup mode) identical frames are cut once and share their surface,
+        also with frames of other sheets loaded before.
+        """
+        aliases = {}    # frame_idx -> first frame_idx with the same key
+        first = {}      # key -> frame_idx
+        for idx in sorted(rects):
+            if idx in keys:
+                aliases[idx] = first.setdefault(keys[idx], idx)
+
+        # indexed frames already are 8-bit colorkey surfaces
+        optimize = self.optimize_blits and spritesheet.get_bitsize() != 8
+
+        if self.lazy_frames:
+            return LazyFrames(spritesheet, rects, scale, tags, aliases, optimize_frame if optimize else None), []
+
+        # frames already held by another sheet
+        shared = {}
+        for idx in first.values():
+            surface = self._shared_frames.get((keys[idx], scale))
+            if surface is not None:
+                shared[idx] = surface
+        to_cut = [idx for idx in rects if aliases.get(idx, idx) == idx and idx not in shared]
+
+        atlas_pages = []
+        if self.use_atlas:
+            formats = {idx: classify_frame(spritesheet.subsurface(rects[idx])) if optimize else BlitFormat.ALPHA
+                       for idx in to_cut}
+
+            # opaque and colorkey frames go onto pages without alpha, transparent pixels filled with the key
+            keyed_sheet, key = None, None
+            if any(fmt != BlitFormat.ALPHA for fmt in formats.values()):
+                key = unused_color(spritesheet)
+                keyed_sheet = pygame.Surface(spritesheet.get_size()).convert()
+                keyed_sheet.fill(key)
+                keyed_sheet.blit(spritesheet, (0, 0))
+
+            cut = {}
+            for sheet, group in ((spritesheet, [i for i in to_cut if formats[i] == BlitFormat.ALPHA]),
+                                 (keyed_sheet, [i for i in to_cut if formats[i] != BlitFormat.ALPHA])):
+                if not group:
+                    continue
+                atlas = TextureAtlas(self.atlas_page_size)
+                sources = {
+                    idx: (sheet.subsurface(rects[idx]), (int(rects[idx].width * scale), int(rects[idx].height * scale)))
+                    for idx in group
+                }
+                cut.update(atlas.pack(sources))
+                atlas_pages += atlas.pages
+
+            for idx, fmt in formats.items():
+                if fmt == BlitFormat.COLORKEY:
+                    cut[idx].set_colorkey(key, pygame.RLEACCEL)  # RLE data is per subsurface, the page is untouched
+        else:
+            cut = {idx: cut_frame(spritesheet, rects[idx], scale) for idx in to_cut}
+            if optimize:
+                cut = {idx: optimize_frame(surface) for idx, surface in cut.items()}
 
-        
+        for idx, surface in cut.items():
+            if idx in keys:
+                self._shared_frames[(keys[idx], scale)] = surface
+        cut.update(shared)
+        return {idx: cut[aliases.get(idx, idx)] for idx in rects}, atlas_pages
 
     # --- SINGLE PNG ---
     def load_png(self, name: str, image_path: str, scale: int = 1):
         if name in self.animations and scale in self.animations[name]:
             raise ValueError(f"PNG '{name}' with scale {scale} already loaded.")
 
-        img = pygame.image.load(image_path)
+        self._build_png(name, pygame.image.load(image_path), image_path, scale)
+
+    def _build_png(self, name: str, img: pygame.Surface, image_path: str, scale: int):
+        """Convert the decoded image and create the AnimationData (main thread only)."""
         base_image = img.convert_alpha() if self.convert_alpha else img.convert()
 
         # create outer dictionary
         if name not in self.animations:
             self.animations[name] = {}
 
-        # always create/store scale 1
-        if 1 not in self.animations[name]:
+        # create/store scale 1 on first load (or when it is requested)
+        if 1 not in self.animations[name] and (scale == 1 or name not in self._sources):
             base_anim = AnimationData(
-                frames={0: base_image},
+                frames={0: optimize_frame(base_image) if self.optimize_blits else base_image},
                 durations={0: 0},
                 tags={},
                 sprite_size=base_image.get_size(),
@@ -215,6 +593,8 @@ class GraphicManager:
             )
 
             scaled_image = pygame.transform.scale(base_image, new_size)
+            if self.optimize_blits:
+                scaled_image = optimize_frame(scaled_image)
 
             scaled_anim = AnimationData(
                 frames={0: scaled_image},
@@ -226,27 +606,204 @@ class GraphicManager:
                 scale=scale
             )
 
-            scaled_anim._source_image_path = self.animations[name][1]._source_image_path  # reference original source
+            scaled_anim._source_image_path = image_path  # reference original source
 
             self.animations[name][scale] = scaled_anim
 
+        self._remember_source(name, True, image_path, None)
+
+    def _remember_source(self, name: str, png: bool, image_path: str, json_path: str | None):
+        """Record where `name` comes from, so any of its scales can be re-created after eviction."""
+        self._sources.setdefault(name, {
+            "png": png,
+            "image_path": image_path,
+            "json_path": json_path,
+            "global_offset": (0, 0),   # scale-1 offsets, filled when scale 1 is evicted
+            "tag_offsets": {},
+            "frame_offsets": {},
+            "scale_offsets": {},       # scale -> offsets of an evicted derived scale, restored on re-creation
+        })
+
+    # --- PARALLEL LOADING ---
+    def load_many(self, spritesheets=(), pngs=(), max_workers: int | None = None):
+        """
+        Load many assets at once. PNG decoding and JSON parsing run on a thread pool
+        (pygame releases the GIL while decoding), the main thread only converts and slices
+        the results as they come in.
+        spritesheets: iterable of (name, image_path, json_path) or (name, image_path, json_path, scale)
+        pngs:         iterable of (name, image_path) or (name, image_path, scale)
+        """
+        spritesheets = [tuple(entry) + (1,) * (4 - len(entry)) for entry in spritesheets]
+        pngs = [tuple(entry) + (1,) * (3 - len(entry)) for entry in pngs]
+
+        for name, *_, scale in spritesheets + pngs:
+            if name in self.animations and scale in self.animations[name]:
+                raise ValueError(f"Animation '{name}' with scale {scale} already loaded.")
+
+        # bundled animations are built straight from the open bundles, nothing to decode
+        spritesheets = [entry for entry in spritesheets if not self._load_bundled(entry[0], entry[3])]
+        pngs = [entry for entry in pngs if not self._load_bundled(entry[0], entry[2])]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            sheet_jobs = [(entry, pool.submit(self._read_spritesheet, entry[1], entry[2])) for entry in spritesheets]
+            png_jobs = [(entry, pool.submit(pygame.image.load, entry[1])) for entry in pngs]
+
+            for (name, image_path, json_path, scale), job in sheet_jobs:
+                img, data = job.result()
+                self._build_spritesheet(name, img, data, image_path, json_path, scale)
+
+            for (name, image_path, scale), job in png_jobs:
+                self._build_png(name, job.result(), image_path, scale)
+
+    # --- BAKED BUNDLE ---
+    def open_bundle(self, path: str) -> bool:
+        """
+        Make a bundle written by bake_bundle.py available. Nothing is built yet: load_many(),
+        the manifest and get_or_create_scaled() take bundled animations from it instead of
+        decoding their sources. Returns False if the bundle is missing, older than its sources or
+        baked with other loader flags (use_atlas, trim_frames, dedup_frames, optimize_blits).
+        """
+        if not os.path.exists(path):
+            return False
+
+        bundle = AssetBundle(path)
+        if bundle.is_stale(bake_flags(self)):
+            print(f"⚠️ Asset bundle '{path}' is out of date (sources or loader flags changed), loading from source. Run bake_bundle.py to update it.")
+            bundle.close()  # releases the file, bake_bundle.py can rewrite it
+            return False
+
+        self._bundles.append(bundle)
+        return True
+
+    def load_bundle(self, path: str) -> bool:
+        """
+        Load every animation from a bundle written by bake_bundle.py.
+        Pixels are memory-mapped, nothing is decoded or scaled. Returns False (and loads nothing)
+        if the bundle is missing or older than its source files.
+        """
+        if not self.open_bundle(path):
+            return False
+
+        for entry in self._bundles[-1].entries:
+            if entry.name in self.animations and entry.scale in self.animations[entry.name]:
+                raise ValueError(f"Animation '{entry.name}' with scale {entry.scale} already loaded.")
+            self._build_bundled(self._bundles[-1], entry)
+        return True
+
+    def _load_bundled(self, name: str, scale: int) -> bool:
+        """Build `name` at `scale` (and its scale 1 if missing) from an open bundle. False if not bundled."""
+        if name in self.indexed_sheets:
+            return False  # bundles hold 32-bit pixels only
+        for bundle in self._bundles:
+            entry = bundle.index.get((name, scale))
+            if entry is None:
+                continue
+            base = bundle.index.get((name, 1))
+            if base is not None and 1 not in self.animations.get(name, {}) and name not in self._sources:
+                self._build_bundled(bundle, base)
+            if scale not in self.animations.get(name, {}):
+                self._build_bundled(bundle, entry)
+            return True
+        return False
+
+    def _build_bundled(self, bundle: AssetBundle, entry):
+        pages = bundle.build_pages(entry)
+        frames = {}
+        views = {}  # identical frames were packed once, share one subsurface per rect
+        for idx, (page, x, y, w, h) in entry.frames.items():
+            key = entry.frame_keys.get(idx)
+            surface = self._shared_frames.get((key, entry.scale)) if key else None
+            if surface is None:
+                if (page, x, y, w, h) not in views:
+                    views[(page, x, y, w, h)] = pages[page].subsurface((x, y, w, h))
+                surface = views[(page, x, y, w, h)]
+                if key:
+                    self._shared_frames[(key, entry.scale)] = surface
+            fmt, colorkey = entry.blit_formats[idx]
+            if fmt != BlitFormat.ALPHA.value:
+                surface.set_alpha(None)  # pages are mapped as BGRA, opaque/colorkey frames skip blending
+            if fmt == BlitFormat.COLORKEY.value:
+                surface.set_colorkey(colorkey, pygame.RLEACCEL)
+            frames[idx] = surface
+
+        anim = AnimationData(frames, entry.durations, entry.tags, entry.sprite_size,
+                             entry.name, png=entry.png, scale=entry.scale)
+        anim.atlas_pages = pages
+        anim.frame_keys = {idx: (key, entry.scale) for idx, key in entry.frame_keys.items()}
+        anim._source_image_path = entry.image_path
+        anim._source_json_path = entry.json_path or None
+
+        anim._global_offset = entry.global_offset
+        anim._tag_offsets = dict(entry.tag_offsets)
+        anim._frame_offsets = dict(entry.frame_offsets)
+        anim.trim_offsets = dict(entry.trim_offsets)
+        if entry.global_offset != (0, 0) or entry.tag_offsets or entry.frame_offsets:
+            anim._rebuild_offsets()
+        else:
+            anim.final_offsets = dict(anim.trim_offsets)
+
+        self.animations.setdefault(entry.name, {})[entry.scale] = anim
+        self._remember_source(entry.name, entry.png, entry.image_path, entry.json_path or None)
+
+    # --- UNLOADING ---
+    def has_users(self, name: str) -> bool:
+        """True if any sprite currently uses any scale of animation `name`."""
+        return any(len(anim.users) for anim in self.animations.get(name, {}).values())
+
+    def unload(self, name: str, scale: int | None = None):
+        """
+        Release animation `name` (all scales if `scale` is None). Sprites that still point at it
+        keep their frames alive until they switch animation.
+        """
+        if scale is None:
+            self.animations.pop(name, None)
+            self._sources.pop(name, None)
+            self._evicted = {key for key in self._evicted if key[0] != name}
+            return
+        if name in self.animations:
+            self.animations[name].pop(scale, None)
+            if not self.animations[name]:
+                self.unload(name)
+
+    # --- PALETTES ---
+    def make_palette(self, name: str, base_name: str, color_map: Dict[tuple, tuple]) -> List[tuple]:
+        """
+        Create palette `name` from the palette of the indexed sheet `base_name`, replacing colors
+        via `color_map` ((r, g, b) -> (r, g, b)). Sprites use it with set_palette(name).
+        """
+        anim = next(iter(self.animations.get(base_name, {}).values()), None)
+        if anim is None:
+            raise ValueError(f"Animation '{base_name}' not loaded.")
+        if anim.palette is None:
+            raise ValueError(f"Animation '{base_name}' is not indexed, load it with indexed=True "
+                             f"(sheets with semi-transparent pixels are always loaded as RGBA).")
+
+        palette = [tuple(color_map.get(tuple(color), color)) for color in anim.palette]
+        self.palettes[name] = palette
+        return palette
+
+    def get_palette(self, name: str) -> List[tuple]:
+        if name not in self.palettes:
+            raise ValueError(f"Palette '{name}' does not exist.")
+        return self.palettes[name]
+
     # ------------------------------------------------------------------
     # CLEAN OFFSET API (delegates to AnimationData)
     # ------------------------------------------------------------------
     def set_global_offset(self, base_name: str, x: int, y: int, scale: int):
         """Set a global (x,y) offset for the animation."""
         anim = self._require_anim(base_name, scale)
-        anim.set_global_offset(x, y, scale)
+        anim.set_global_offset(x, y)
 
     def set_tag_offset(self, base_name: str, tag_name: str, x: int, y: int, scale: int):
         """Set a tag-specific (x,y) offset."""
         anim = self._require_anim(base_name, scale)
-        anim.set_tag_offset(tag_name, x, y, scale)
+        anim.set_tag_offset(tag_name, x, y)
 
     def set_frame_offset(self, base_name: str, frame_idx: int, x: int, y: int, scale: int):
         """Set a frame-specific (x,y) offset."""
         anim = self._require_anim(base_name, scale)
-        anim.set_frame_offset(frame_idx, x, y, scale)
+        anim.set_frame_offset(frame_idx, x, y)
 
     def _require_anim(self, name: str, scale: int) -> "AnimationData":
         """Internal helper to validate animation existence."""
@@ -255,9 +812,15 @@ class GraphicManager:
         return self.animations[name][scale]
 
     
+    def prefetch(self, name: str, scale: int, tags: List[str] | None = None):
+        """Materialize the frames of `tags` (None = all) of a lazily loaded animation now."""
+        self._require_anim(name, scale).prefetch(tags)
+
     def get_animationdata_reference(self, name: str, scale: int) -> "AnimationData":
-        """Return a reference to the existing AnimationData instance."""
-        if scale not in self.animations[name]:
+        """Return a reference to the existing AnimationData instance (re-created if the budget evicted it)."""
+        if (name, scale) in self._evicted:
+            self.get_or_create_scaled(name, scale)
+        if scale not in self.animations.get(name, {}):
             raise ValueError(f"Animation '{name}' with scale {scale} not loaded.")
         return self.animations[name][scale]
     
@@ -272,62 +835,337 @@ class GraphicManager:
         scale: int
     ):
 
-        original = self.animations[anim_name][scale].frames[frame_idx]
+        anim = self.animations[anim_name][scale]
+        original = anim.frames[frame_idx]
+
+        # nothing to transform, never cache the original
+        if angle == 0 and not flip_x and not flip_y:
+            return original
+
+        key = self._transform_key(anim, frame_idx, angle, flip_x, flip_y)
+
+        with self._cache_lock:
+            cached = self._rotation_cache.get(key)
+        if cached is not None:
+            return cached
+
+        if self._rotates_untrimmed(anim, frame_idx, angle):
+            original = self._untrimmed(anim, frame_idx)
+        working = self._transform(self._rotation_source(original, angle), angle, flip_x, flip_y)
 
-        key = (anim_name, frame_idx, angle, flip_x, flip_y, scale)
+        with self._cache_lock:
+            self._rotation_cache.put(key, working, anim_name)
 
-        if key in self._rotation_cache:
-            return self._rotation_cache[key]
+        return working
 
+    def _frame_identity(self, anim: AnimationData, frame_idx: int):
+        """Cache identity of a frame: its content key if known, so identical frames share transforms."""
+        return anim.frame_keys.get(frame_idx) or (anim.base_name, frame_idx, anim.scale)
+
+    def _transform_key(self, anim: AnimationData, frame_idx: int, angle: int, flip_x: bool, flip_y: bool):
+        identity = self._frame_identity(anim, frame_idx)
+        if self._rotates_untrimmed(anim, frame_idx, angle):
+            identity = (identity, anim.trim_offsets[frame_idx], anim.sprite_size)  # same pixels, other box
+        return identity, angle, flip_x, flip_y
+
+    def _rotates_untrimmed(self, anim: AnimationData, frame_idx: int, angle: int) -> bool:
+        """
+        Whether a trimmed frame is rotated in its untrimmed box: off a right angle the rotation
+        resamples around the box center, rotating the trimmed rect would shift and resample it differently.
+        """
+        return (bool(angle % 90) and frame_idx in anim.trim_offsets
+                and anim.frames[frame_idx].get_size() != anim.sprite_size)
+
+    def _untrimmed(self, anim: AnimationData, frame_idx: int) -> pygame.Surface:
+        """A new surface of the untrimmed frame size with trimmed frame `frame_idx` at its original place."""
+        frame = anim.frames[frame_idx]
+        trim_x, trim_y = anim.trim_offsets[frame_idx]
+        width, height = frame.get_size()
+        sprite_w, sprite_h = anim.sprite_size
+        dest = (sprite_w // 2 + trim_x - width // 2, sprite_h // 2 + trim_y - height // 2)
+
+        colorkey = frame.get_colorkey()
+        if frame.get_flags() & pygame.SRCALPHA or colorkey is None:
+            padded = pygame.Surface(anim.sprite_size, pygame.SRCALPHA)  # an opaque frame gets transparent padding
+            padded.blit(frame, dest, special_flags=pygame.BLEND_RGBA_ADD)  # copy, no blending onto the empty padding
+        else:
+            padded = pygame.Surface(anim.sprite_size, 0, frame)  # keeps 8-bit frames indexed
+            if frame.get_bitsize() == 8:
+                padded.set_palette(frame.get_palette())
+            padded.fill(colorkey)
+            padded.set_colorkey(colorkey, frame.get_flags() & pygame.RLEACCEL)
+            padded.blit(frame, dest)
+        return padded
+
+    def _rotation_source(self, original: pygame.Surface, angle: int) -> pygame.Surface:
+        """
+        `original` ready to be rotated by `angle`: off right angles an opaque frame needs per-pixel
+        alpha, the padded corners must stay transparent. convert_alpha() needs the display, main thread only.
+        """
+        if angle % 90 and blit_format(original) == BlitFormat.OPAQUE:
+            return original.convert_alpha()
+        return original
+
+    def _transform(self, original: pygame.Surface, angle: int, flip_x: bool, flip_y: bool) -> pygame.Surface:
+        """Flip and rotate `original` (see _rotation_source()). No display access, safe on the prebake worker."""
         # 1. flip first
         working = pygame.transform.flip(original, flip_x, flip_y) if (flip_x or flip_y) else original
 
-        # 2. no rotation
-        if angle == 0:
-            self._rotation_cache[key] = working
-            return working
+        # 2. rotate
+        # No offset correction, we rely on center-based rect placement in Sprite.draw()
+        if angle != 0:
+            working = pygame.transform.rotate(working, angle)
 
-        # 3. rotate
-        rotated = pygame.transform.rotate(working, angle)
+        return working
 
-        # 4. IMPORTANT:
-        # No offset correction anymore.
-        # We rely on center-based rect placement in Sprite.draw()
-        self._rotation_cache[key] = rotated
+    # ------------------------------------------------------------------
+    # PREBAKE (fill the rotation cache in the background)
+    # ------------------------------------------------------------------
+    def prebake(self, specs: List[BakeSpec]):
+        """
+        Transform all frames declared by `specs` on a worker thread and store them in the
+        rotation cache, so Sprite.draw() only hits the cache during gameplay.
+        A running bake is cancelled. Progress: prebake_done / prebake_total.
+        """
+        jobs = []
+        queued = set()  # identical frames are baked once
+        # the worker only gets copies: transforming a surface locks it, a blit of the same surface
+        # on the main thread at that moment fails ("Surfaces must not be locked during blit")
+        sources = {}    # (frame identity, rotated off a right angle) -> snapshot of the frame, see _rotation_source()
+        for spec in specs:
+            anim = self._require_anim(spec.anim_name, spec.scale)
+
+            flips = [(False, False)]
+            if spec.flip_x:
+                flips.append((True, False))
+            if spec.flip_y:
+                flips.append((False, True))
+            if spec.flip_x and spec.flip_y:
+                flips.append((True, True))
+            angles = range(0, 360, spec.angle_step) if spec.angle_step else (0,)
+
+            if spec.tags is None:
+                frame_indices = list(anim.frames)
+            else:
+                frame_indices = [idx for tag in spec.tags
+                                 for idx in range(anim.tags[tag]["from"], anim.tags[tag]["to"] + 1)]
+
+            for idx in frame_indices:
+                for flip_x, flip_y in flips:
+                    for angle in angles:
+                        if angle == 0 and not flip_x and not flip_y:
+                            continue  # never cached, see get_rotated_frame()
+                        key = self._transform_key(anim, idx, angle, flip_x, flip_y)
+                        if key not in queued:
+                            queued.add(key)
+                            source_key = (key[0], bool(angle % 90))
+                            source = sources.get(source_key)
+                            if source is None:
+                                untrimmed = self._rotates_untrimmed(anim, idx, angle)
+                                frame = self._untrimmed(anim, idx) if untrimmed else anim.frames[idx]
+                                # converted here on the main thread, the worker only flips and rotates
+                                source = self._rotation_source(frame, angle)
+                                if source is anim.frames[idx]:
+                                    source = source.copy()
+                                sources[source_key] = source
+                            jobs.append((spec.anim_name, key, angle, flip_x, flip_y, source))
+
+        self._bake_generation += 1
+        self.prebake_done = 0
+        self.prebake_total = len(jobs)
+        if not jobs:
+            return
+
+        self._bake_thread = threading.Thread(target=self._prebake_worker, args=(jobs, self._bake_generation), daemon=True)
+        self._bake_thread.start()
+
+    def is_prebaking(self) -> bool:
+        return self._bake_thread is not None and self._bake_thread.is_alive()
+
+    def get_prebake_progress(self) -> float:
+        """0.0 - 1.0, 1.0 when there is nothing (left) to bake."""
+        return self.prebake_done / self.prebake_total if self.prebake_total else 1.0
+
+    def cancel_prebake(self):
+        self._bake_generation += 1
+
+    def _prebake_worker(self, jobs, generation):
+        for anim_name, key, angle, flip_x, flip_y, original in jobs:
+            if generation != self._bake_generation:
+                return  # cancelled or superseded by a newer bake
+
+            with self._cache_lock:
+                baked = key in self._rotation_cache
+            if not baked:
+                working = self._transform(original, angle, flip_x, flip_y)
+                with self._cache_lock:
+                    if generation == self._bake_generation:
+                        self._rotation_cache.put(key, working, anim_name)
+            self.prebake_done += 1
+
+    # ------------------------------------------------------------------
+    # ROTATION CACHE (byte-budgeted LRU)
+    # ------------------------------------------------------------------
+    def set_rotation_cache_budget(self, max_bytes: int):
+        """Set the global byte budget of the rotation/flip cache (trims the cache right away)."""
+        with self._cache_lock:
+            self._rotation_cache.set_max_bytes(max_bytes)
+
+    def set_rotation_cache_limit(self, anim_name: str, max_bytes: int | None):
+        """Limit the cached bytes for one animation (all scales). None removes the limit."""
+        with self._cache_lock:
+            self._rotation_cache.set_anim_limit(anim_name, max_bytes)
+
+    def get_rotation_cache_stats(self) -> dict:
+        cache = self._rotation_cache
+        return {
+            "entries": len(cache),
+            "bytes": cache.bytes_used,
+            "max_bytes": cache.max_bytes,
+            "hits": cache.hits,
+            "misses": cache.misses,
+            "evictions": cache.evictions,
+        }
+
+    def clear_rotation_cache(self):
+        """Drop all cached transformed frames (and cancel a running bake). Called by GameStateManager on every state change."""
+        self.cancel_prebake()
+        with self._cache_lock:
+            self._rotation_cache.clear()
+
+    def get_surface_stats(self) -> dict:
+        """
+        Count surfaces and pixel bytes of all loaded animations.
+        `standalone_*` is what one surface per frame costs, `resident_*` is what is actually
+        held (atlas pages, lazy spritesheets and frames, every shared surface counted once).
+        """
+        stats = {"standalone_count": 0, "standalone_bytes": 0, "resident_count": 0, "resident_bytes": 0}
+        seen = set()
+        for scales in self.animations.values():
+            for anim in scales.values():
+                stats["standalone_count"] += len(anim.frames)
+                if isinstance(anim.frames, LazyFrames):
+                    stats["standalone_bytes"] += anim.frames.full_bytes()
+                else:
+                    stats["standalone_bytes"] += sum(surface_bytes(f) for f in anim.frames.values())
+
+                for surface in self._backing_surfaces(anim):
+                    if id(surface) not in seen:
+                        seen.add(id(surface))
+                        stats["resident_count"] += 1
+                        stats["resident_bytes"] += surface_bytes(surface)
+        return stats
+
+    def _backing_surfaces(self, anim: AnimationData):
+        """The surfaces that own the pixels of `anim` (pages, spritesheet, standalone frames)."""
+        yield from anim.atlas_pages
+        frames = anim.frames.values()
+        if isinstance(anim.frames, LazyFrames):
+            yield anim.frames.spritesheet
+            frames = anim.frames.resident_frames()
+        for frame in frames:
+            yield frame.get_parent() or frame
 
-        return rotated
-    
     def get_or_create_scaled(self, name: str, scale: int):
         """
         Ensure scale `factor` exists for animation `name`.
-        Derives from the scale=1 version, copying offsets proportionally.
+        Derives from the source files (or the bundle), copying the scale=1 offsets proportionally
+        (or restoring the offsets the scale had when the budget evicted it).
+        Afterwards the memory budget is enforced.
         """
-        if name not in self.animations:
+        if name not in self._sources:
             raise ValueError(f"Animation '{name}' not loaded.")
-        if scale in self.animations[name]:
+        if scale in self.animations.get(name, {}):
             return  # already exists
 
-        source = self.animations[name][1]  # always derive from scale=1
+        source = self._sources[name]
+        saved = source["scale_offsets"].pop(scale, None)
+        if saved is not None:
+            (global_offset, tag_offsets, frame_offsets), factor = saved, 1
+        else:
+            (global_offset, tag_offsets, frame_offsets), factor = self._base_offsets(name), scale
 
-        if source.png:
-            self.load_png(name, source._source_image_path, scale=scale)
+        if self._load_bundled(name, scale):
+            pass
+        elif source["png"]:
+            self.load_png(name, source["image_path"], scale=scale)
         else:
-            self.load_spritesheet(name, source._source_image_path, source._source_json_path, scale=scale)
+            self.load_spritesheet(name, source["image_path"], source["json_path"], scale=scale)
+        self._evicted.discard((name, scale))
 
         scaled = self.animations[name][scale]
 
-        # Copy offsets proportionally from scale=1
-        gx, gy = source._global_offset
+        # Copy offsets proportionally from scale=1 (factor 1 for the saved offsets of an evicted scale)
+        gx, gy = global_offset
         if gx != 0 or gy != 0:
-            scaled.set_global_offset(int(gx * scale), int(gy * scale))
+            scaled.set_global_offset(int(gx * factor), int(gy * factor))
 
-        for tag_name, (tx, ty) in source._tag_offsets.items():
+        for tag_name, (tx, ty) in tag_offsets.items():
             if tx != 0 or ty != 0:
-                scaled.set_tag_offset(tag_name, int(tx * scale), int(ty * scale))
+                scaled.set_tag_offset(tag_name, int(tx * factor), int(ty * factor))
 
-        for frame_idx, (fx, fy) in source._frame_offsets.items():
+        for frame_idx, (fx, fy) in frame_offsets.items():
             if fx != 0 or fy != 0:
-                scaled.set_frame_offset(frame_idx, int(fx * scale), int(fy * scale))
+                scaled.set_frame_offset(frame_idx, int(fx * factor), int(fy * factor))
+
+        self.enforce_memory_budget(keep=(name, scale))
+
+    def _base_offsets(self, name: str):
+        """Scale-1 offsets of `name`: from the resident scale 1, or as recorded when it was evicted."""
+        base = self.animations.get(name, {}).get(1)
+        if base is not None:
+            return base._global_offset, dict(base._tag_offsets), dict(base._frame_offsets)
+        source = self._sources[name]
+        return source["global_offset"], source["tag_offsets"], source["frame_offsets"]
+
+    # --- MEMORY BUDGET ---
+    def get_memory_usage(self) -> Dict[tuple, int]:
+        """Resident pixel bytes per (name, scale). Shared surfaces count for the first animation holding them."""
+        usage = {}
+        seen = set()
+        for name, scales in self.animations.items():
+            for scale, anim in scales.items():
+                nbytes = 0
+                for surface in self._backing_surfaces(anim):
+                    if id(surface) not in seen:
+                        seen.add(id(surface))
+                        nbytes += surface_bytes(surface)
+                usage[(name, scale)] = nbytes
+        return usage
+
+    def enforce_memory_budget(self, keep: tuple | None = None) -> int:
+        """
+        Evict unused scales (largest first) until the resident animations fit into `memory_budget`.
+        Scales used by a sprite and `keep` are never evicted; scale 1 only once another scale
+        of the same animation is resident. Evicted scales are re-created on next use, with their offsets.
+        Returns the number of bytes freed (surfaces still shared with a resident animation don't count).
+        """
+        if self.memory_budget is None:
+            return 0
+
+        usage = self.get_memory_usage()
+        start = resident = sum(usage.values())
+        for (name, scale), nbytes in sorted(usage.items(), key=lambda item: -item[1]):
+            if resident <= self.memory_budget:
+                break
+            scales = self.animations[name]
+            if (name, scale) == keep or len(scales[scale].users):
+                continue
+            if scale == 1 and len(scales) == 1:
+                continue  # the only resident copy
+
+            anim = scales[scale]
+            offsets = anim._global_offset, dict(anim._tag_offsets), dict(anim._frame_offsets)
+            source = self._sources[name]
+            if scale == 1:
+                source["global_offset"], source["tag_offsets"], source["frame_offsets"] = offsets
+            else:
+                source["scale_offsets"][scale] = offsets
+            del scales[scale]
+            self._evicted.add((name, scale))
+            # a shared surface (dedup, lazy sheet) is only released with its last holder
+            resident = sum(self.get_memory_usage().values())
+        return start - resident
     
 
 
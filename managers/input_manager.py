@@ -1,3 +1,4 @@
+import json
 import pygame
 from enum import Enum, auto
 from decorators import singleton
@@ -67,12 +68,40 @@ class InputManager:
         self._pressed_actions = [set(), set()]
         self._prev_pressed_actions = [set(), set()]
 
+        # Scripted input (headless runs): callable(frame, player_index) -> set[Action], replaces keyboard/gamepad
+        self.script = None
+        self._frame = 0
+
     def update(self, dt):
         for i in (0, 1):
             # Store previous state by copying current
             self._prev_pressed_actions[i] = self._pressed_actions[i].copy()
             # Update current state
-            self._pressed_actions[i] = self._quering_pressed_actions(i)
+            if self.script is not None:
+                self._pressed_actions[i] = set(self.script(self._frame, i))
+            else:
+                self._pressed_actions[i] = self._quering_pressed_actions(i)
+        self._frame += 1
+
+    def load_script(self, path: str):
+        """
+        Replace keyboard/gamepad input by a JSON script of held actions per frame range:
+            [{"player": 0, "from": 0, "to": 59, "actions": ["RIGHT", "A"]}, ...]
+        ("to" inclusive). Frames are counted from the next update().
+        """
+        with open(path, "r") as f:
+            entries = json.load(f)
+        spans = [(e["player"], e["from"], e["to"], {Action[name] for name in e["actions"]}) for e in entries]
+
+        def script(frame, player_index):
+            actions = set()
+            for player, start, end, held in spans:
+                if player == player_index and start <= frame <= end:
+                    actions |= held
+            return actions
+
+        self.script = script
+        self._frame = 0
 
     def get_pressed_actions(self, player_index: int) -> set:
         return self._pressed_actions[player_index]
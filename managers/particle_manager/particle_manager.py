@@ -1,24 +1,121 @@
-import random
-from managers.particle_manager.particle import Particle
-
+import math
+import numpy as np
+import pygame
+from managers.view_manager.view_manager import ViewManager
+from gameobjects.sprite import RenderLayer
 
 
 class ParticleManager:
-    def __init__(self):
-        self.particles = []
+    """
+    Pooled particle system: all particles live in fixed-capacity NumPy arrays, packed at the front
+    (dead particles are compacted away in update(), their slots are reused by the next emit).
+    A particle is a filled circle that falls with `gravity` and shrinks by `shrink` px/s until it is gone.
+    Positions are screen pixels of the game surface.
+    """
+
+    def __init__(self, capacity: int = 4096, color=(230, 5, 76), layer: int = RenderLayer.OBJECTS):
+        self.capacity = capacity
+        self.color = color
+        self.layer = layer          # render queue layer used by draw() without a surface
+        self.gravity = 720.0        # px/s² (0.2 px per frame² at 60 fps)
+        self.shrink = 6.0           # px/s the radius loses (0.1 px per frame at 60 fps)
+
+        self.pos = np.zeros((capacity, 2))
+        self.vel = np.zeros((capacity, 2))
+        self.size = np.zeros(capacity)          # radius in px
+        self.life = np.zeros(capacity)          # seconds left (inf = until shrunk away)
+        self.count = 0                          # alive particles, [0:count]
+
+        self._vm: ViewManager = ViewManager()
+        self._rng = np.random.default_rng()
+        self._stamps = {}           # (radius, color) -> prebaked circle surface
 
     def emit(self, pos):
-        vel = [random.randint(0, 20) / 10 - 1, -2]
-        size = random.randint(1, 3)
-        self.particles.append(Particle(pos, vel, size))
+        """Spawn one particle at `pos` (small upward spark)."""
+        self.burst(pos, 1, velocity_x=(-60, 60), velocity_y=(-120, -120), size=(1, 3))
+
+    def burst(self, pos, count: int, speed=(60, 180), angle=(0, 360), size=(1, 3), life=None,
+              velocity_x=None, velocity_y=None):
+        """
+        Spawn `count` particles at `pos` in one go (hit sparks, dust).
+        Velocity is `speed` px/s in a direction within `angle` degrees (0 = right, 90 = up),
+        or uniform in `velocity_x`/`velocity_y` if those are given. `size` is the radius range in px,
+        `life` an optional lifetime range in seconds. Particles beyond `capacity` are dropped.
+        """
+        start = self.count
+        count = min(count, self.capacity - start)
+        if count <= 0:
+            return
+        end = start + count
+        rng = self._rng
+
+        self.pos[start:end] = pos
+        if velocity_x is not None or velocity_y is not None:
+            self.vel[start:end, 0] = rng.uniform(*(velocity_x or (0, 0)), count)
+            self.vel[start:end, 1] = rng.uniform(*(velocity_y or (0, 0)), count)
+        else:
+            directions = np.radians(rng.uniform(*angle, count))
+            speeds = rng.uniform(*speed, count)
+            self.vel[start:end, 0] = np.cos(directions) * speeds
+            self.vel[start:end, 1] = -np.sin(directions) * speeds  # screen y points down
+        self.size[start:end] = rng.integers(size[0], size[1], count, endpoint=True)
+        self.life[start:end] = rng.uniform(*life, count) if life else math.inf
+        self.count = end
 
     def update(self, dt):
-        for p in self.particles:
-            p.update(dt)
+        """Integrate, shrink and age all particles by `dt` seconds, then compact the dead ones away."""
+        n = self.count
+        if not n:
+            return
+        self.pos[:n] += self.vel[:n] * dt
+        self.vel[:n, 1] += self.gravity * dt
+        self.size[:n] -= self.shrink * dt
+        self.life[:n] -= dt
+
+        alive = (self.size[:n] >= 1) & (self.life[:n] > 0)  # a radius below 1 px draws nothing
+        if alive.all():
+            return
+        self.count = int(alive.sum())
+        for array in (self.pos, self.vel, self.size, self.life):
+            array[:self.count] = array[:n][alive]
+
+    def clear(self):
+        self.count = 0
+
+    def draw(self, surface: pygame.Surface | None = None):
+        """
+        Draw all particles with prebaked circle stamps: in one Surface.blits() call onto `surface`,
+        or (None) through the ViewManager render queue on `layer`.
+        """
+        n = self.count
+        if not n:
+            return
+        pos, size = self.pos[:n], self.size[:n]
+        if surface is None and self._vm.render_scale != 1:
+            # render surface pixels, like Sprite.get_blit()
+            pos, size = pos / self._vm.render_scale, size / self._vm.render_scale
+        # every live particle keeps at least 1 px, small ones would vanish after dividing by render_scale
+        radii = np.maximum(np.rint(size).astype(int), 1)
+        top_left = pos.astype(int) - radii[:, None]
 
-        # clean dead particles (SAFE way)
-        self.particles = [p for p in self.particles if p.is_alive()]
+        radii = radii.tolist()
+        stamps = {r: self._stamp(r) for r in set(radii)}
+        blits = zip(map(stamps.__getitem__, radii), map(tuple, top_left.tolist()))
+        if surface is None:
+            self._vm.submit_many(blits, self.layer)
+        else:
+            surface.blits(blits, doreturn=False)
 
-    def draw(self, surface):
-        for p in self.particles:
-            p.draw(surface)
\ No newline at end of file
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+    def _stamp(self, radius: int) -> pygame.Surface:
+        stamp = self._stamps.get((radius, self.color))
+        if stamp is None:
+            colorkey = (255, 0, 255) if tuple(self.color[:3]) != (255, 0, 255) else (0, 0, 0)
+            stamp = pygame.Surface((radius * 2 + 1, radius * 2 + 1)).convert()
+            stamp.fill(colorkey)
+            pygame.draw.circle(stamp, self.color, (radius, radius), radius)
+            stamp.set_colorkey(colorkey, pygame.RLEACCEL)
+            self._stamps[(radius, self.color)] = stamp
+        return stamp
@@ -0,0 +1,196 @@
+import numpy as np
+import pygame
+from decorators import singleton
+
+
+class BodyVector:
+    """
+    Vector2-like view of one body's row in a PhysicsWorld array; reading and writing x/y go to the world.
+    In-place operators (+=, -=, *=) write to the world, other operators and Vector2 methods
+    (copy(), distance_to(), ...) work on a pygame.Vector2 of the current value.
+    """
+    __slots__ = ("_world", "_field", "_body")
+
+    def __init__(self, world: "PhysicsWorld", field: str, body: int):
+        self._world = world
+        self._field = field  # "pos" or "vel"
+        self._body = body
+
+    @property
+    def x(self) -> float:
+        return float(getattr(self._world, self._field)[self._body, 0])
+
+    @x.setter
+    def x(self, value: float):
+        getattr(self._world, self._field)[self._body, 0] = value
+
+    @property
+    def y(self) -> float:
+        return float(getattr(self._world, self._field)[self._body, 1])
+
+    @y.setter
+    def y(self, value: float):
+        getattr(self._world, self._field)[self._body, 1] = value
+
+    def update(self, x, y=None):
+        """Set both components, like pygame.Vector2.update()."""
+        if y is None:
+            x, y = x
+        getattr(self._world, self._field)[self._body] = (x, y)
+
+    def __len__(self):
+        return 2
+
+    def __getitem__(self, i):
+        return float(getattr(self._world, self._field)[self._body, i])
+
+    def __iter__(self):
+        row = getattr(self._world, self._field)[self._body]
+        return iter((float(row[0]), float(row[1])))
+
+    def __repr__(self):
+        return f"BodyVector({self.x}, {self.y})"
+
+    def copy(self) -> pygame.Vector2:
+        return pygame.Vector2(self.x, self.y)
+
+    def __getattr__(self, name):
+        # the rest of the Vector2 API (distance_to, length, normalize, ...) on a snapshot
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.copy(), name)
+
+    def __eq__(self, other):
+        return self.copy() == other
+
+    def __add__(self, other):
+        return self.copy() + other
+
+    def __radd__(self, other):
+        return other + self.copy()
+
+    def __sub__(self, other):
+        return self.copy() - other
+
+    def __rsub__(self, other):
+        return other - self.copy()
+
+    def __mul__(self, other):
+        return self.copy() * other
+
+    def __rmul__(self, other):
+        return other * self.copy()
+
+    def __truediv__(self, other):
+        return self.copy() / other
+
+    def __neg__(self):
+        return -self.copy()
+
+    def __iadd__(self, other):
+        self.update(self.copy() + other)
+        return self
+
+    def __isub__(self, other):
+        self.update(self.copy() - other)
+        return self
+
+    def __imul__(self, other):
+        self.update(self.copy() * other)
+        return self
+
+    __hash__ = None  # mutable, like pygame.Vector2
+
+
+@singleton
+class PhysicsWorld:
+    """
+    All physics bodies in struct-of-arrays form, stepped in one vectorized call per tick (GameState.update).
+    PhysicsComponents only hold a body index; freed indices are reused (free list), the arrays grow by doubling.
+    Arrays may be reallocated when the world grows, so never keep a slice of them across add() calls.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self.pos = np.zeros((capacity, 2))                # world position
+        self.vel = np.zeros((capacity, 2))                # velocity in px/s
+        self.gravity = np.zeros(capacity)                 # px/s²
+        self.ground_y = np.zeros(capacity)                # y the body lands on
+        self.on_ground = np.zeros(capacity, dtype=bool)
+        self.active = np.zeros(capacity, dtype=bool)      # stepped by step(), False for free slots
+        self.count = 0          # slots in use or freed, [0:count] is what step() looks at
+        self._free = set()      # freed slots below count
+        self._components = {}   # body -> PhysicsComponent attached to it, detached by clear()
+
+    def add(self, pos=(0, 0), vel=(0, 0), gravity: float = 0.0, ground_y: float = 0.0, component=None) -> int:
+        """Add a body and return its index. `component` (the PhysicsComponent viewing it) is detached by clear()."""
+        if self._free:
+            body = self._free.pop()
+        else:
+            if self.count == len(self.active):
+                self._grow()
+            body = self.count
+            self.count += 1
+        self.pos[body] = pos
+        self.vel[body] = vel
+        self.gravity[body] = gravity
+        self.ground_y[body] = ground_y
+        self.on_ground[body] = False
+        self.active[body] = True
+        if component is not None:
+            self._components[body] = component
+        return body
+
+    def remove(self, body: int):
+        """Free the slot of `body`, add() reuses it."""
+        if body >= self.count or body in self._free:
+            raise ValueError(f"Body {body} is not in the world.")
+        self.active[body] = False
+        self._components.pop(body, None)
+        if body == self.count - 1:
+            self.count -= 1
+            # drop freed slots at the end, keeps the stepped range short
+            while self.count and self.count - 1 in self._free:
+                self._free.remove(self.count - 1)
+                self.count -= 1
+        else:
+            self._free.add(body)
+
+    def clear(self):
+        """
+        Remove all bodies (GameState.clear_objects() on a state change). Attached components are
+        detached first, so an object that is still around keeps its position and owns no stale body index.
+        """
+        for component in list(self._components.values()):
+            component.detach()
+        self.active[:self.count] = False
+        self.count = 0
+        self._free = set()
+
+    def step(self, dt: float):
+        """Gravity, integration and ground clamping of every active body."""
+        n = self.count
+        if not n:
+            return
+        active = self.active[:n]
+        pos, vel = self.pos[:n], self.vel[:n]
+
+        vel[:, 1] += np.where(active, self.gravity[:n] * dt, 0.0)
+        pos += vel * dt * active[:, None]  # inactive bodies move by 0
+
+        landed = active & (pos[:, 1] >= self.ground_y[:n])
+        pos[landed, 1] = self.ground_y[:n][landed]
+        vel[landed, 1] = 0
+        on_ground = self.on_ground[:n]
+        on_ground[active] = landed[active]
+
+    @property
+    def body_count(self) -> int:
+        return self.count - len(self._free)
+
+    def _grow(self):
+        capacity = len(self.active) * 2
+        for name in ("pos", "vel", "gravity", "ground_y", "on_ground", "active"):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
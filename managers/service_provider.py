@@ -7,6 +7,7 @@ from managers.input_manager import InputManager
 from managers.gamestate_manager import GameStateManager
 from managers.sound_manager import SoundManager
 from managers.settings_manager.settings_manager import SettingsManager
+from managers.physics_world import PhysicsWorld
 
 @singleton
 class ServiceProvider:
@@ -18,8 +19,10 @@ class ServiceProvider:
         self.sound_manager = SoundManager()
         self.settings_manager = SettingsManager()
         self.view_manager = ViewManager()
+        self.physics_world = PhysicsWorld()
 
         # Bind service provider to managers that need it
+        self.gamestate_manager.bind_service_provider(self)
         self.debug_manager.bind_service_provider(self)
         self.view_manager.bind_service_provider(self)
 
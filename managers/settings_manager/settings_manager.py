@@ -1,6 +1,11 @@
 import json
 import os
+from decorators import singleton
 
+HEADLESS_ENV = "PYMUGEN_HEADLESS"  # "1"/"0" overrides the headless setting
+
+
+@singleton
 class SettingsManager:
     def __init__(self, filename="settings.json"):
         self.filename = filename
@@ -13,9 +18,15 @@ class SettingsManager:
         self.sfx_volume = 1.0
         self.resolution = (800, 600)
         self.fullscreen = False
+        self.headless = False  # no window and no audio device (build farm, containers, benchmarks)
+        self._loaded = False  # load() reads the file once, every manager may call it
+        self._apply_environment()
 
-    def load(self):
-        """Load settings from file."""
+    def load(self, reload: bool = False):
+        """Load settings from file (once, unless `reload`)."""
+        if self._loaded and not reload:
+            return
+        self._loaded = True
         if not os.path.exists(os.path.join(self.folder, self.filename)):
             print("Settings file not found. Using defaults.")
             return
@@ -29,6 +40,8 @@ class SettingsManager:
         self.sfx_volume = data.get("sfx_volume", self.sfx_volume)
         self.resolution = tuple(data.get("resolution", self.resolution))
         self.fullscreen = data.get("fullscreen", self.fullscreen)
+        self.headless = data.get("headless", self.headless)
+        self._apply_environment()
 
         print("Settings loaded.")
 
@@ -40,7 +53,8 @@ class SettingsManager:
             "music_volume": self.music_volume,
             "sfx_volume": self.sfx_volume,
             "resolution": list(self.resolution),  # JSON needs list, not tuple
-            "fullscreen": self.fullscreen
+            "fullscreen": self.fullscreen,
+            "headless": self.headless
         }
 
         with open(os.path.join(self.folder, self.filename), "w") as f:
@@ -48,6 +62,10 @@ class SettingsManager:
 
         print("Settings saved.")
 
+    def _apply_environment(self):
+        if os.environ.get(HEADLESS_ENV) in ("0", "1"):
+            self.headless = os.environ[HEADLESS_ENV] == "1"
+
 
 if __name__ == "__main__":
     settings = SettingsManager()
@@ -1,4 +1,5 @@
 import pygame
+from concurrent.futures import ThreadPoolExecutor
 from decorators import singleton
 from managers.settings_manager.settings_manager import SettingsManager
 
@@ -37,6 +38,29 @@ class SoundManager:
         sound.set_volume(self._get_effective_sfx_volume())
         self.sounds[name] = sound
 
+    def load_many(self, sounds=(), music=(), max_workers=None):
+        """
+        Load many sounds at once, decoding them on a thread pool.
+        sounds / music: iterables of (name, path)
+        """
+        for name, path in music:
+            self.load_music(name, path)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            jobs = [(name, pool.submit(pygame.mixer.Sound, path)) for name, path in sounds]
+            for name, job in jobs:
+                sound = job.result()
+                sound.set_volume(self._get_effective_sfx_volume())
+                self.sounds[name] = sound
+
+    def unload_sound(self, name):
+        self.sounds.pop(name, None)
+
+    def unload_music(self, name):
+        if name == self.current_music:
+            return  # keep the track that is playing
+        self.music_tracks.pop(name, None)
+
     # ------------------------
     # MUSIC CONTROL
     # ------------------------
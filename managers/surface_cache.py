@@ -0,0 +1,104 @@
+import pygame
+from collections import OrderedDict
+
+
+class SurfaceCache:
+    """
+    Byte-budgeted LRU cache for transformed surfaces.
+    Every entry belongs to an animation name, so besides the global budget each
+    animation can get its own limit (e.g. a rotating projectile must not push the
+    fighters' flipped frames out of the cache).
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.anim_limits = {}           # anim_name -> max bytes for this animation
+
+        self._entries = OrderedDict()   # key -> (surface, anim_name, nbytes), oldest first
+        self._bytes = 0
+        self._anim_bytes = {}           # anim_name -> bytes currently cached
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    @property
+    def bytes_used(self) -> int:
+        return self._bytes
+
+    def set_max_bytes(self, max_bytes: int):
+        """Change the global budget, evicting the oldest entries right away if it was lowered."""
+        self.max_bytes = max_bytes
+        self._evict_to_budget()
+
+    def set_anim_limit(self, anim_name: str, max_bytes: int | None):
+        """Limit the bytes cached for one animation. None removes the limit."""
+        if max_bytes is None:
+            self.anim_limits.pop(anim_name, None)
+            return
+        self.anim_limits[anim_name] = max_bytes
+        self._evict_anim(anim_name)
+
+    def get(self, key) -> pygame.Surface | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, surface: pygame.Surface, anim_name: str):
+        if key in self._entries:
+            self._remove(key)
+
+        nbytes = surface.get_bytesize() * surface.get_width() * surface.get_height()
+        self._entries[key] = (surface, anim_name, nbytes)
+        self._bytes += nbytes
+        self._anim_bytes[anim_name] = self._anim_bytes.get(anim_name, 0) + nbytes
+
+        self._evict_anim(anim_name)
+        self._evict_to_budget()
+
+    def clear(self):
+        """Drop all entries (counters are kept)."""
+        self._entries.clear()
+        self._bytes = 0
+        self._anim_bytes.clear()
+
+    def reset_counters(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+    def _evict_anim(self, anim_name: str):
+        limit = self.anim_limits.get(anim_name)
+        if limit is None or self._anim_bytes.get(anim_name, 0) <= limit:
+            return
+        # oldest entries of this animation first, always keep the newest one
+        for key in [k for k, e in self._entries.items() if e[1] == anim_name][:-1]:
+            if self._anim_bytes[anim_name] <= limit:
+                break
+            self._remove(key)
+            self.evictions += 1
+
+    def _evict_to_budget(self):
+        # oldest first, always keep the newest entry
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _remove(self, key):
+        _, anim_name, nbytes = self._entries.pop(key)
+        self._bytes -= nbytes
+        self._anim_bytes[anim_name] -= nbytes
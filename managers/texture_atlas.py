@@ -0,0 +1,82 @@
+import math
+import pygame
+from typing import Dict, List, Tuple
+
+
+class TextureAtlas:
+    """
+    Packs many frame surfaces into a few large page surfaces (simple shelf packing).
+    The packed frames are handed out as subsurface views into the pages, so a whole
+    spritesheet at one scale lives in a handful of pixel buffers instead of one
+    standalone surface per frame.
+    """
+
+    def __init__(self, page_size: int = 2048):
+        self.page_size = page_size
+        self.pages: List[pygame.Surface] = []   # the surfaces that actually own the pixels
+
+    def pack(self, sources: Dict[int, Tuple[pygame.Surface, Tuple[int, int]]]) -> Dict[int, pygame.Surface]:
+        """
+        Pack `sources` (frame_idx -> (source_surface, target_size)) into new pages.
+        Each source is scaled to its target size directly into its slot on the page
+        (no intermediate surfaces). Returns frame_idx -> subsurface view.
+        """
+        if not sources:
+            return {}
+
+        # --- Layout: tallest frames first, fill shelves left to right ---
+        order = sorted(sources, key=lambda idx: (-sources[idx][1][1], idx))
+        layouts = []        # per page: list of (frame_idx, rect)
+        page_extents = []   # per page: [used_w, used_h]
+        shelf_page = None   # index of the page currently being filled
+
+        # Aim for roughly square pages: shelf width ~ sqrt(total area), but at least the widest frame
+        fitting = [size for _, size in sources.values() if size[0] <= self.page_size and size[1] <= self.page_size]
+        shelf_width = 0
+        if fitting:
+            area = sum(w * h for w, h in fitting)
+            shelf_width = min(self.page_size, max(max(w for w, _ in fitting), math.ceil(math.sqrt(area))))
+        shelf_x = shelf_y = shelf_h = 0
+
+        for idx in order:
+            w, h = sources[idx][1]
+
+            # Frames larger than a page get a page of their own
+            if w > self.page_size or h > self.page_size:
+                layouts.append([(idx, pygame.Rect(0, 0, w, h))])
+                page_extents.append([w, h])
+                continue
+
+            if shelf_page is not None and shelf_x + w > shelf_width:  # next shelf
+                shelf_y += shelf_h
+                shelf_x = shelf_h = 0
+            if shelf_page is None or shelf_y + h > self.page_size:  # next page
+                layouts.append([])
+                page_extents.append([0, 0])
+                shelf_page = len(layouts) - 1
+                shelf_x = shelf_y = shelf_h = 0
+
+            layouts[shelf_page].append((idx, pygame.Rect(shelf_x, shelf_y, w, h)))
+            extent = page_extents[shelf_page]
+            extent[0] = max(extent[0], shelf_x + w)
+            extent[1] = max(extent[1], shelf_y + h)
+            shelf_x += w
+            shelf_h = max(shelf_h, h)
+
+        # --- Blit: allocate each page only as big as its used area ---
+        frames = {}
+        for layout, (used_w, used_h) in zip(layouts, page_extents):
+            template = sources[layout[0][0]][0]
+            page = pygame.Surface((used_w, used_h), template.get_flags() & pygame.SRCALPHA, template)
+            for idx, rect in layout:
+                source = sources[idx][0]
+                # scale() with a dest surface writes the raw pixels, no alpha blending
+                pygame.transform.scale(source, rect.size, page.subsurface(rect))
+                frames[idx] = page.subsurface(rect)
+            self.pages.append(page)
+
+        return frames
+
+    def get_bytes(self) -> int:
+        """Total pixel memory owned by the pages."""
+        return sum(p.get_bytesize() * p.get_width() * p.get_height() for p in self.pages)
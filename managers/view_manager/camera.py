@@ -1,5 +1,6 @@
 import pygame
 import random
+import numpy as np
 
 class Camera:
     def __init__(self, view_width, view_height):
@@ -17,6 +18,12 @@ class Camera:
         self._x = 0.0
         self._y = 0.0
 
+        # Render interpolation: positions are projected with the camera between the previous and the current tick
+        self._prev_x = 0.0
+        self._prev_y = 0.0
+        self._view_x = 0.0  # interpolated position used by apply_*()
+        self._view_y = 0.0
+
         self.follow_enabled = True
         self.clamp_to_world = True 
 
@@ -53,9 +60,38 @@ class Camera:
             max_y = self.y_travel_max
             self._y = max(min_y, min(self._y, max_y))   
 
+    @property
+    def view_position(self):
+        """Interpolated camera position the current frame is projected with (see set_interpolation())."""
+        return (self._view_x, self._view_y)
+
+    @property
+    def world_rect(self) -> pygame.Rect:
+        """Stage area in world space (set by BaseStage.configure_camera()), size 0 before a stage is configured."""
+        return pygame.Rect(self.world_center_x - self.world_width // 2, self.world_center_y - self.world_height // 2,
+                           self.world_width, self.world_height)
+
+    @property
+    def shake_offset(self):
+        """Current screenshake displacement (x, y)."""
+        return (self._shake_x, self._shake_y)
+
     # --------------------------
     # Public API
     # --------------------------
+    def store_previous(self):
+        """Remember the position at the start of a simulation tick (called by ViewManager.update())."""
+        self._prev_x = self._x
+        self._prev_y = self._y
+
+    def set_interpolation(self, alpha: float):
+        """Project with the position `alpha` (0..1) of the way from the previous to the current tick."""
+        if alpha >= 1.0:
+            self._view_x, self._view_y = self._x, self._y
+        else:
+            self._view_x = self._prev_x + (self._x - self._prev_x) * alpha
+            self._view_y = self._prev_y + (self._y - self._prev_y) * alpha
+
     def add_trauma(self, amount: float):
         """Add screenshake trauma. 0.0–1.0, stacks up to 1."""
         self._trauma = min(1.0, self._trauma + amount)
@@ -72,11 +108,31 @@ class Camera:
         self._update_shake(dt)
 
     #this is used by the render manager to apply the camera offset to the worldpos-position of objects
+    def apply_xy(self, x: float, y: float, shake_factor: float = 1.0) -> tuple:
+        """World position -> screen position, without allocating anything but the result tuple."""
+        return (x - (self._view_x - self._shake_x * shake_factor), y - (self._view_y - self._shake_y * shake_factor))
+
     def apply_vec2(self, pos, shake_factor: float = 1.0) -> pygame.Vector2:
-        shake_x = self._shake_x * shake_factor
-        shake_y = self._shake_y * shake_factor
-        return pygame.Vector2(pos) - pygame.Vector2(self._x - shake_x, self._y - shake_y)
-    
+        return pygame.Vector2(self.apply_xy(pos[0], pos[1], shake_factor))
+
+    def apply(self, rect: pygame.Rect, shake_factor: float = 1.0) -> pygame.Rect:
+        """World rect -> screen rect (rounded to whole pixels)."""
+        x, y = self.apply_xy(rect.x, rect.y, shake_factor)
+        return pygame.Rect(round(x), round(y), rect.width, rect.height)
+
+    def apply_many(self, positions, shake_factors=1.0, out=None) -> np.ndarray:
+        """
+        Project an (n, 2) array of world positions in one call. `shake_factors` is a scalar or
+        an array of n factors, `out` an optional (n, 2) float array to write the result into.
+        """
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+        if out is None:
+            out = np.empty_like(positions)
+        shake_factors = np.asarray(shake_factors, dtype=np.float64)
+        np.subtract(positions[:, 0], self._view_x - self._shake_x * shake_factors, out=out[:, 0])
+        np.subtract(positions[:, 1], self._view_y - self._shake_y * shake_factors, out=out[:, 1])
+        return out
+
 
 
     # --------------------------
@@ -0,0 +1,51 @@
+import pygame
+from managers.view_manager.view_manager import ViewManager
+
+
+class LayerCompositor:
+    """
+    Renders a fixed set of layers (GameObjects, bottom first) into one cached, opaque
+    render surface sized surface and submits that as a single blit.
+
+    The cache is only re-rendered when the blit of a layer changes, i.e. its frame or its
+    screen position in whole pixels (camera scroll, shake, animation). With a parked camera
+    the layers cost one opaque blit per frame instead of one per layer.
+
+    The composite covers the whole render surface (clear color included), so it has to be
+    the lowest layer of the render queue.
+    """
+
+    def __init__(self, layers: list, layer: int = 0):
+        self.layers = layers  # GameObjects, drawn in list order
+        self.layer = layer    # render queue layer of the composite
+
+        self._vm: ViewManager = ViewManager()
+        self._surface = pygame.Surface(self._vm.render_surface.get_size()).convert()
+        self._key = None  # (frame, top left, palette id) of every layer at the last render
+
+    def draw(self):
+        blits = [layer.get_screen_blit() for layer in self.layers]
+        key = [(blit[0], blit[1], id(blit[2])) if blit else None for blit in blits]
+        if key != self._key:
+            self._render(blits)
+            self._key = key
+        self._vm.submit(self._surface, (0, 0), self.layer)
+
+    def invalidate(self):
+        """Re-render on the next draw() (e.g. after a layer's frame pixels were changed in place)."""
+        self._key = None
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+    def _render(self, blits):
+        self._surface.fill(self._vm.CLEAR_COLOR)
+        for blit in blits:
+            if blit is None:
+                continue
+            frame, dest, palette = blit
+            if palette is not None:
+                frame.set_palette(palette)
+            self._surface.blit(frame, dest)
+        # same surface object, new pixels: the render queue diff can't see this
+        self._vm.mark_dirty(self._surface.get_rect())
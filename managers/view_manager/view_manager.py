@@ -1,7 +1,10 @@
 import pygame
+from collections import Counter
+from operator import itemgetter
 from decorators import singleton
 from managers.debug_manager import DebugManager
 from managers.view_manager.camera import Camera
+from managers.settings_manager.settings_manager import SettingsManager
 
 @singleton
 class ViewManager:
@@ -20,6 +23,8 @@ class ViewManager:
         self.VIEW_TOP_BOUND = 86 #first visible pixel on the up
         self.VIEW_BOTTOM_BOUND = 454 #first visible pixel on the down
         self.VIEW_HEIGHT = self.VIEW_BOTTOM_BOUND - self.VIEW_TOP_BOUND # 368
+        self.view_rect = pygame.Rect(self.VIEW_LEFT_BOUND, self.VIEW_TOP_BOUND, self.VIEW_WIDTH, self.VIEW_HEIGHT)
+        self.screen_rect = pygame.Rect(0, 0, self.GAME_WINDOW_WIDTH, self.GAME_WINDOW_HEIGHT)  # whole game surface
     
         
 
@@ -28,16 +33,46 @@ class ViewManager:
         self._draw_rect = pygame.Rect(0, 0, 0, 0)  # Initialize the draw rect for reuse
 
         self.camera = Camera(self.VIEW_WIDTH, self.VIEW_HEIGHT) 
-
-        self.screen = pygame.display.set_mode(
-            (self.GAME_WINDOW_WIDTH, self.GAME_WINDOW_HEIGHT),
-            pygame.SCALED | pygame.FULLSCREEN,
-            vsync=1
-        )
+        self.interpolation_alpha = 1.0  # see set_interpolation()
+
+        # Headless: no window (main.py selects the SDL dummy drivers before pygame.init()),
+        # draw_to_screen() only hands the finished frame to capture_hook
+        self.headless = SettingsManager().headless
+        self.capture_hook = None  # callable(game_surface, frame_index), headless only
+        self.frame_index = 0      # frames presented so far
+
+        if self.headless:
+            self.screen = pygame.display.set_mode((self.GAME_WINDOW_WIDTH, self.GAME_WINDOW_HEIGHT))
+        else:
+            self.screen = pygame.display.set_mode(
+                (self.GAME_WINDOW_WIDTH, self.GAME_WINDOW_HEIGHT),
+                pygame.SCALED | pygame.FULLSCREEN,
+                vsync=1
+            )
         pygame.display.set_caption("Game View")
 
         self.game_surface = pygame.Surface((self.GAME_WINDOW_WIDTH, self.GAME_WINDOW_HEIGHT))
 
+        # Low-resolution rendering (see set_render_scale): the render queue draws into render_surface,
+        # flush() upscales it into game_surface. With render_scale 1 both are the same surface.
+        self.render_scale = 1
+        self.render_surface = self.game_surface
+
+        # Render queue: sprites submit (layer, surface, dest, palette), flush() draws them sorted by layer
+        self._render_queue = []
+
+        # Culling: GameObjects outside view_rect skip draw() (and debug_draw() if cull_debug_draw)
+        self.culling = True
+        self.cull_debug_draw = False
+        self.cull_stats = {"drawn": 0, "culled": 0}  # GameObject.draw() calls of the current frame
+
+        # Dirty-rect presentation (opt-in): only areas whose queued blits changed are copied to the screen
+        self.dirty_rects = False
+        self._dirty = []             # rects of game_surface that changed this frame
+        self._prev_blits = []        # (surface, dest, palette id) of the previous frame's queue
+        self._prev_camera = None     # camera position + shake of the previous frame
+        self._full_redraw = True     # next frame presents the whole surface
+
         
 
     def bind_service_provider(self, sp):
@@ -46,14 +81,144 @@ class ViewManager:
         
 
     def update(self, dt):
-        pass
+        """Called once per simulation tick, before the state is updated."""
+        self.camera.store_previous()
+
+    def set_interpolation(self, alpha: float):
+        """
+        Render the state `alpha` (0..1) of the way from the previous to the current simulation tick
+        (main.py: accumulator / SIM_DT). GameObjects and the camera interpolate their positions.
+        """
+        self.interpolation_alpha = alpha
+        self.camera.set_interpolation(alpha)
+
+    def set_render_scale(self, scale: int):
+        """
+        Draw sprites into a target `scale` times smaller than the game surface, with assets at
+        1/`scale` of their requested scale, and upscale once per frame in flush().
+        Call before any asset is loaded or sprite created.
+        """
+        if scale < 1 or self.GAME_WINDOW_WIDTH % scale or self.GAME_WINDOW_HEIGHT % scale:
+            raise ValueError(f"Render scale must divide {self.GAME_WINDOW_WIDTH}x{self.GAME_WINDOW_HEIGHT}, got {scale}.")
+        self.render_scale = scale
+        if scale == 1:
+            self.render_surface = self.game_surface
+        else:
+            size = (self.GAME_WINDOW_WIDTH // scale, self.GAME_WINDOW_HEIGHT // scale)
+            self.render_surface = pygame.Surface(size).convert()
+        self._full_redraw = True
+
+    def asset_scale(self, scale: int) -> int:
+        """Scale of the asset that is drawn for a requested (game surface) `scale`."""
+        return max(1, scale // self.render_scale)
+
+    def check_scale(self, scale: int):
+        """Raise if sprites can't be drawn at `scale`: it has to be a multiple of render_scale."""
+        if scale % self.render_scale:
+            raise ValueError(f"Scale {scale} is not a multiple of the render scale {self.render_scale}.")
 
     def clear(self):
-        self.game_surface.fill(self.CLEAR_COLOR)
+        self.render_surface.fill(self.CLEAR_COLOR)
+        self.cull_stats["drawn"] = self.cull_stats["culled"] = 0
+
+    def is_on_screen(self, rect, in_stage: bool = True) -> bool:
+        """
+        True if `rect` (screen space) overlaps the visible stage area, or with `in_stage` False
+        the whole game surface (screen-space objects like HUD elements may sit in the border).
+        """
+        return (self.view_rect if in_stage else self.screen_rect).colliderect(rect)
+
+    def submit(self, surface, dest, layer=0, palette=None):
+        """
+        Queue `surface` to be drawn at `dest` (top left, render surface pixels) by flush().
+        Lower layers are drawn first, entries of the same layer in submission order.
+        `palette` is set on the surface right before its blit (shared indexed frames).
+        """
+        self._render_queue.append((layer, surface, dest, palette))
+
+    def submit_many(self, blits, layer=0):
+        """Queue an iterable of (surface, dest) pairs on one layer (e.g. particles), see submit()."""
+        self._render_queue.extend((layer, surface, dest, None) for surface, dest in blits)
+
+    def flush(self):
+        """
+        Draw all queued entries sorted by layer, batched into as few Surface.blits() calls as possible.
+        In low-resolution mode the render surface is then upscaled into game_surface.
+        """
+        queue = self._render_queue
+        queue.sort(key=itemgetter(0))  # stable: same layer keeps submission order
+        if self.dirty_rects:
+            self._collect_dirty(queue)
+        self._draw_queue(queue)
+        if self.render_surface is not self.game_surface:
+            pygame.transform.scale(self.render_surface, self.game_surface.get_size(), self.game_surface)
+
+    def _draw_queue(self, queue):
+        batch = []
+        for _, surface, dest, palette in queue:
+            if palette is None:
+                batch.append((surface, dest))
+                continue
+            # the palette belongs to this one blit, the batch before it has to be drawn first
+            if batch:
+                self.render_surface.blits(batch, doreturn=False)
+                batch = []
+            surface.set_palette(palette)
+            self.render_surface.blit(surface, dest)
+        if batch:
+            self.render_surface.blits(batch, doreturn=False)
+        queue.clear()
+
+    def mark_dirty(self, rect):
+        """Report a changed area of the render surface that was not drawn through the render queue (dirty-rect mode)."""
+        if self.dirty_rects:
+            self._dirty.append(pygame.Rect(rect))
+
+    def invalidate(self):
+        """Present the whole game surface next frame (e.g. after a state change)."""
+        self._full_redraw = True
 
     def draw_to_screen(self):
-        self.screen.blit(self.game_surface, (0, 0))
-        pygame.display.flip()
+        self.frame_index += 1
+        if self.headless:
+            if self.capture_hook is not None:
+                self.capture_hook(self.game_surface, self.frame_index - 1)
+            return
+        if not self.dirty_rects:
+            self.screen.blit(self.game_surface, (0, 0))
+            pygame.display.flip()
+            return
+
+        # a scrolling/shaking camera moves everything, debug drawing bypasses the render queue
+        camera_state = (*self.camera.view_position, *self.camera.shake_offset)
+        debug_on = self.debug_manager is not None and self.debug_manager.debug_on
+        if self._full_redraw or debug_on or camera_state != self._prev_camera:
+            self.screen.blit(self.game_surface, (0, 0))
+            pygame.display.flip()
+        elif self._dirty:
+            screen_rect = self.screen.get_rect()
+            s = self.render_scale
+            rects = [pygame.Rect(r.x * s, r.y * s, r.w * s, r.h * s).clip(screen_rect) for r in self._dirty]
+            for rect in rects:
+                self.screen.blit(self.game_surface, rect, rect)
+            pygame.display.update(rects)
+
+        self._dirty.clear()
+        self._prev_camera = camera_state
+        self._full_redraw = debug_on  # the frame after the overlay is switched off has to erase it
+
+    def _collect_dirty(self, queue):
+        """Mark the rects of blits that appeared or disappeared since the previous frame (old and new position of a moved sprite)."""
+        blits = [(surface, dest, id(palette)) for _, surface, dest, palette in queue]
+        if blits == self._prev_blits:
+            return
+        current, previous = Counter(blits), Counter(self._prev_blits)
+        changed = (current - previous) + (previous - current)
+        if not changed:
+            self._full_redraw = True  # same blits in a different order
+        for surface, dest, _ in changed:
+            self._dirty.append(pygame.Rect(dest, surface.get_size()))
+        self._prev_blits = blits
 
     def draw_rect(self, x, y, width, height, color):
         self._draw_rect.topleft = (x, y)
@@ -1,6 +1,7 @@
 from gameobjects.game_object import GameObject
-from gameobjects.sprite import RenderAnchor
+from gameobjects.sprite import RenderAnchor, RenderLayer
 from managers.service_provider import ServiceProvider
+from managers.view_manager.layer_compositor import LayerCompositor
 
 class BaseStage():
     def __init__(self, world_pos):
@@ -10,6 +11,11 @@ class BaseStage():
 
         self.stage_front = GameObject(world_pos, RenderAnchor.BOTTOMCENTER) #not affected by camera
         self.stage_back = GameObject(world_pos, RenderAnchor.BOTTOMCENTER)
+        self.stage_front.layer = RenderLayer.STAGE
+        self.stage_back.layer = RenderLayer.STAGE
+
+        # both layers are rendered into one cached surface, re-rendered only when camera or frames change
+        self.compositor = LayerCompositor([self.stage_front, self.stage_back], RenderLayer.STAGE)
 
         self.stage_width = 0 # will be set by the stage, but we initialize it to 0 here
         self.stage_height = 0 # will be set by the stage, but we initialize it to 0 here
@@ -21,10 +27,13 @@ class BaseStage():
         self.stage_front.update(dt)
         self.stage_back.update(dt)
 
+    @property
+    def layers(self) -> tuple:
+        """Both layer objects, animated by GameState.update() with the other objects."""
+        return self.stage_front, self.stage_back
+
     def draw(self):
-        
-        self.stage_front.draw() 
-        self.stage_back.draw()
+        self.compositor.draw()
 
     def debug_draw(self):
         #self.stage_front.debug_draw() not affected by camera, so no need to debug draw